@@ -1,9 +1,16 @@
 import streamlit as st
 from streamlit_extras.switch_page_button import switch_page
 
+from interviewly.session import start_background_workers, readiness_indicator
+
 # --- Page Configuration ---
 st.set_page_config(page_title="InterviewLY", page_icon="💼", layout="wide")
 
+# --- Model Warm-Up ---
+# Workers load the models in the background while the landing page renders
+start_background_workers()
+readiness_indicator()
+
 # --- Custom CSS for EXTREMELY MASSIVE TITLE ---
 st.markdown("""
     <style>
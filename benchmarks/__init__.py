@@ -0,0 +1 @@
+"""Performance benchmarks for InterviewLY (run from the repository root)."""
@@ -0,0 +1,9 @@
+"""Helpers shared by the benchmark scripts."""
+import sys
+import resource
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
@@ -0,0 +1,199 @@
+"""Reproducible performance suite for the analysis stages and full pipelines.
+
+Generates deterministic synthetic interviews (see benchmarks.synthetic), times
+every stage in its own process (so peak RSS is per stage) and writes
+machine-readable results. With ``--baseline`` the run is compared against a
+saved result file and any stage slower than ``--threshold`` percent is
+reported as a regression (exit code 1).
+
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --baseline bench.json --threshold 10
+    python -m benchmarks.suite --quick --stages decode,pipeline
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import multiprocessing
+
+from benchmarks.common import peak_rss_mb
+from benchmarks.synthetic import make_video
+
+# name: (width, height, fps, seconds, face, hands)
+CASES = {
+    "360p-30fps-face-hands": (640, 360, 30, 20, True, True),
+    "720p-30fps-face-hands": (1280, 720, 30, 20, True, True),
+    "1080p-30fps-face-hands": (1920, 1080, 30, 20, True, True),
+    "720p-60fps-face": (1280, 720, 60, 20, True, False),
+    "720p-30fps-empty": (1280, 720, 30, 20, False, False),
+    "360p-30fps-long": (640, 360, 30, 120, True, True),
+}
+QUICK_CASES = ("360p-30fps-face-hands",)
+
+STAGES = ("decode", "decode+convert", "eyecontact", "posture", "gesture", "emotion", "pipeline",
+          "audio_extract", "transcribe")
+DEFAULT_STAGES = ("decode", "decode+convert", "eyecontact", "posture", "gesture", "pipeline", "audio_extract")
+ANALYZER_STAGES = {
+    "eyecontact": ["eyecontact"],
+    "posture": ["posture"],
+    "gesture": ["gesture"],
+    "emotion": ["emotion"],
+    "pipeline": ["eyecontact", "posture", "gesture", "emotion"],
+}
+
+
+# --- Stage Runners (executed in a fresh process each) ---
+def _decode(video_path, convert):
+    import cv2
+
+    cap = cv2.VideoCapture(video_path)
+    frames = 0
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        if convert:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        frames += 1
+    cap.release()
+    return frames
+
+
+def _prepare(stage, video_path):
+    """Imports modules and builds analyzers and models for a stage; returns the part to time.
+
+    Only the frame or segment loop is timed, so results compare steady-state
+    throughput rather than import and model-loading costs. Long audio is still
+    transcribed in fresh worker processes that load their own models.
+    """
+    if stage in ("decode", "decode+convert"):
+        import cv2
+
+        return lambda: _decode(video_path, convert=stage == "decode+convert")
+    if stage in ANALYZER_STAGES:
+        from interviewly.pipeline import build_analyzers, run_pipeline
+
+        names = ANALYZER_STAGES[stage]
+        if "emotion" in names:
+            from interviewly.warmup import warm_emotion
+
+            warm_emotion()
+        analyzers = build_analyzers(names)
+        return lambda: run_pipeline(video_path, analyzers)
+    if stage == "audio_extract":
+        from interviewly import speech
+
+        return lambda: speech.extract_audio(video_path)
+    if stage == "transcribe":
+        from interviewly import speech
+
+        audio = speech.extract_audio(video_path)
+        speech.load_model(speech.transcription_profile("fast")["model_size"])
+        return lambda: list(speech.iter_transcribe(audio, "fast"))
+    raise ValueError(f"Unknown stage: {stage}")
+
+
+def run_stage(stage, video_path, fps, seconds):
+    """Times one stage on one video and returns its metrics."""
+    run = _prepare(stage, video_path)
+    started = time.perf_counter()
+    output = run()
+    elapsed = time.perf_counter() - started
+
+    frames = None
+    if stage in ("decode", "decode+convert"):
+        frames = output
+    elif stage in ANALYZER_STAGES:
+        frames = int(fps * seconds)
+    return {
+        "seconds": elapsed,
+        "frames": frames,
+        "fps": frames / elapsed if frames and elapsed else None,
+        "real_time_factor": elapsed / seconds,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+# --- Baseline Comparison ---
+def compare(results, baseline, threshold):
+    """Returns stages whose time grew by more than ``threshold`` percent against the baseline."""
+    previous = {(row["case"], row["stage"]): row for row in baseline["results"] if "seconds" in row}
+    regressions = []
+    for row in results:
+        old = previous.get((row["case"], row["stage"]))
+        if old is None or "seconds" not in row:
+            continue
+        change = (row["seconds"] - old["seconds"]) / old["seconds"] * 100
+        row["change_percent"] = change
+        if change > threshold:
+            regressions.append({"case": row["case"], "stage": row["stage"], "change_percent": change,
+                                "baseline_seconds": old["seconds"], "seconds": row["seconds"]})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark InterviewLY stages on synthetic interviews.")
+    parser.add_argument("--cases", help=f"comma-separated case names (default all: {', '.join(CASES)})")
+    parser.add_argument("--stages", default=",".join(DEFAULT_STAGES), help=f"comma-separated, from: {', '.join(STAGES)}")
+    parser.add_argument("--quick", action="store_true", help="only the smallest case")
+    parser.add_argument("--media-dir", help="keep generated media here (default: a temporary directory)")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", help="compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    case_names = QUICK_CASES if args.quick else (args.cases.split(",") if args.cases else list(CASES))
+    stages = args.stages.split(",")
+    media_dir = args.media_dir or tempfile.mkdtemp(prefix="interviewly-bench-")
+    os.makedirs(media_dir, exist_ok=True)
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for case in case_names:
+        width, height, fps, seconds, face, hands = CASES[case]
+        video_path = os.path.join(media_dir, f"{case}.mp4")
+        if not os.path.exists(video_path):
+            make_video(video_path, width, height, fps, seconds, face, hands)
+
+        for stage in stages:
+            row = {"case": case, "stage": stage}
+            try:
+                with context.Pool(1) as pool:
+                    row.update(pool.apply(run_stage, (stage, video_path, fps, seconds)))
+            except Exception as e:
+                row["error"] = str(e)
+            results.append(row)
+            fps_text = f"{row['fps']:8.1f} fps" if row.get("fps") else " " * 12
+            status = f"{row['seconds']:8.2f}s {fps_text} RTF {row['real_time_factor']:.3f} " \
+                     f"RSS {row['peak_rss_mb']:.0f} MiB" if "seconds" in row else f"ERROR {row['error']}"
+            print(f"{case:<24} {stage:<15} {status}")
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        report["regressions"] = regressions
+        for regression in regressions:
+            print(f"REGRESSION {regression['case']} {regression['stage']}: "
+                  f"{regression['baseline_seconds']:.2f}s -> {regression['seconds']:.2f}s "
+                  f"(+{regression['change_percent']:.1f}%)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
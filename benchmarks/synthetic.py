@@ -0,0 +1,86 @@
+"""Deterministic synthetic interview media for the benchmarks.
+
+Videos show a drawn head-and-shoulders figure that sways slowly, optionally
+with a face and raised hands, over a static background; audio is a mix of
+voiced-like harmonic bursts and pauses. The same arguments always produce
+byte-identical frames and samples, so timings are comparable across runs.
+Drawn figures are not guaranteed to be detected by the models: the suite
+measures cost, not accuracy.
+"""
+import os
+import wave
+import shutil
+import subprocess
+
+import cv2
+import numpy as np
+
+AUDIO_SAMPLE_RATE = 16000
+
+
+def make_audio(path, seconds, seed=0):
+    """Writes a 16 kHz mono WAV of speech-like bursts separated by pauses."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * AUDIO_SAMPLE_RATE)) / AUDIO_SAMPLE_RATE
+    pitch = 120 + 30 * np.sin(2 * np.pi * 0.3 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / AUDIO_SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    envelope = (np.sin(2 * np.pi * 0.4 * t) > -0.3).astype(np.float32)
+    signal = 0.3 * voice * envelope + 0.01 * rng.standard_normal(t.size)
+    samples = np.clip(signal * 32767, -32768, 32767).astype(np.int16)
+
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(AUDIO_SAMPLE_RATE)
+        f.writeframes(samples.tobytes())
+    return path
+
+
+def draw_frame(index, width, height, fps, face=True, hands=True):
+    """Renders one frame of the synthetic interview."""
+    frame = np.full((height, width, 3), (70, 60, 50), dtype=np.uint8)
+    sway = int(0.03 * width * np.sin(2 * np.pi * 0.2 * index / fps))
+    cx, cy = width // 2 + sway, height // 2
+    unit = min(width, height)
+
+    # Shoulders and torso
+    cv2.ellipse(frame, (cx, cy + unit // 2), (unit // 3, unit // 4), 0, 180, 360, (120, 80, 40), -1)
+    if face:
+        head = unit // 7
+        cv2.circle(frame, (cx, cy - unit // 12), head, (150, 180, 220), -1)
+        for dx in (-head // 3, head // 3):
+            cv2.circle(frame, (cx + dx, cy - unit // 12 - head // 5), max(2, head // 8), (40, 30, 30), -1)
+        cv2.ellipse(frame, (cx, cy - unit // 12 + head // 3), (head // 3, head // 8), 0, 0, 180, (60, 60, 160), 2)
+    if hands:
+        lift = int(0.05 * unit * np.sin(2 * np.pi * 0.5 * index / fps))
+        for side in (-1, 1):
+            cv2.circle(frame, (cx + side * unit // 4, cy + unit // 4 - lift), unit // 20, (150, 180, 220), -1)
+    return frame
+
+
+def make_video(path, width=640, height=360, fps=30, seconds=10, face=True, hands=True, audio=True, seed=0):
+    """Writes a synthetic MP4; muxes synthetic audio in when ffmpeg is available."""
+    silent_path = path if not audio else path + ".silent.mp4"
+    writer = cv2.VideoWriter(silent_path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    for index in range(int(seconds * fps)):
+        writer.write(draw_frame(index, width, height, fps, face, hands))
+    writer.release()
+
+    if not audio:
+        return path
+    if shutil.which("ffmpeg") is None:
+        os.replace(silent_path, path)
+        return path
+
+    audio_path = make_audio(path + ".wav", seconds, seed)
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-i", silent_path, "-i", audio_path,
+             "-c:v", "copy", "-c:a", "aac", "-shortest", path],
+            check=True
+        )
+    finally:
+        os.remove(silent_path)
+        os.remove(audio_path)
+    return path
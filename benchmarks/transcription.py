@@ -0,0 +1,100 @@
+"""Benchmark the transcription profiles on a local audio corpus.
+
+The corpus is a directory of audio or video files, each with a reference
+transcript next to it (``interview1.wav`` + ``interview1.txt``). Every
+profile runs in its own process so peak RSS is measured per profile.
+
+    python -m benchmarks.transcription --corpus path/to/corpus --output transcription.json
+"""
+import os
+import json
+import time
+import argparse
+import multiprocessing
+
+from interviewly import speech
+from benchmarks.common import peak_rss_mb
+
+MEDIA_EXTENSIONS = (".wav", ".mp3", ".flac", ".m4a", ".mp4", ".mov", ".mkv")
+
+
+def load_corpus(corpus_dir):
+    """Returns ``[(media_path, reference_text)]`` for every file with a reference transcript."""
+    corpus = []
+    for name in sorted(os.listdir(corpus_dir)):
+        stem, extension = os.path.splitext(name)
+        reference_path = os.path.join(corpus_dir, stem + ".txt")
+        if extension.lower() in MEDIA_EXTENSIONS and os.path.exists(reference_path):
+            with open(reference_path, encoding="utf-8") as f:
+                corpus.append((os.path.join(corpus_dir, name), f.read()))
+    return corpus
+
+
+def run_profile(profile_name, corpus):
+    """Transcribes the corpus with one profile and returns its aggregate numbers."""
+    from faster_whisper import WhisperModel
+
+    profile = speech.transcription_profile(profile_name)
+    model = WhisperModel(profile["model_size"], device="cpu", compute_type="int8")
+
+    audio_seconds = 0.0
+    decode_seconds = 0.0
+    errors = []
+    for media_path, reference in corpus:
+        audio = speech.extract_audio(media_path)
+        audio_seconds += len(audio) / speech.SAMPLE_RATE
+
+        started = time.perf_counter()
+        segments, _ = model.transcribe(
+            audio,
+            beam_size=profile["beam_size"],
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=500)
+        )
+        hypothesis = " ".join(segment.text for segment in segments)
+        decode_seconds += time.perf_counter() - started
+        errors.append(speech.word_error_rate(reference, hypothesis))
+
+    return {
+        "profile": profile_name,
+        "model_size": profile["model_size"],
+        "beam_size": profile["beam_size"],
+        "files": len(corpus),
+        "audio_seconds": audio_seconds,
+        "decode_seconds": decode_seconds,
+        "real_time_factor": decode_seconds / audio_seconds if audio_seconds else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "word_error_rate": sum(errors) / len(errors) if errors else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark transcription profiles (RTF, peak RSS, WER).")
+    parser.add_argument("--corpus", required=True, help="directory of media files with .txt references")
+    parser.add_argument("--profiles", default=",".join(speech.TRANSCRIPTION_PROFILES),
+                        help="comma-separated profile names")
+    parser.add_argument("--output", help="write the results as JSON to this path")
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        parser.error(f"no media files with reference transcripts in {args.corpus}")
+
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for profile_name in args.profiles.split(","):
+        with context.Pool(1) as pool:
+            results.append(pool.apply(run_profile, (profile_name, corpus)))
+
+    print(f"{'profile':<10} {'model':<6} {'beam':>4} {'RTF':>7} {'peak RSS MiB':>13} {'WER':>7}")
+    for row in results:
+        print(f"{row['profile']:<10} {row['model_size']:<6} {row['beam_size']:>4} "
+              f"{row['real_time_factor']:>7.3f} {row['peak_rss_mb']:>13.0f} {row['word_error_rate']:>7.3f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Shared analysis engine used by the InterviewLY Streamlit pages."""
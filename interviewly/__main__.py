@@ -0,0 +1,5 @@
+import sys
+
+from interviewly.cli import main
+
+sys.exit(main())
@@ -0,0 +1,327 @@
+import time
+
+import numpy as np
+import mediapipe as mp
+
+from interviewly.sampling import SamplingPolicy
+from interviewly.preprocess import FramePreprocessor
+from interviewly.graphs import graph_pool
+from interviewly.cache import ANALYZER_VERSIONS
+from interviewly.scoring import (
+    GESTURES, FACE_POINTS, POSE_POINTS, HAND_POINTS, MAX_HANDS,
+    as_points, eye_contact_labels, posture_labels, gesture_labels, frame_weights, ratio_score, gesture_score,
+)
+
+# --- MediaPipe Modules ---
+mp_face_mesh = mp.solutions.face_mesh
+mp_pose = mp.solutions.pose
+mp_hands = mp.solutions.hands
+
+LANDMARK_DTYPE = np.float16  # recorded landmarks are normalized coordinates, ~1e-3 precision is plenty
+
+
+class FrameAnalyzer:
+    """Base class for analyzers fed by the shared frame pipeline.
+
+    ``version`` must be bumped (in cache.ANALYZER_VERSIONS) whenever the model
+    or scoring rules change, and ``result_params`` names the constructor
+    arguments that affect the result; both feed the result cache key and the
+    version also keys background jobs. ``metrics`` is set by the pipeline to a
+    StageMetrics when the run is instrumented. ``landmark_count`` is non-zero
+    for analyzers that can record their landmarks.
+    """
+    name = None
+    version = "1"
+    result_params = ()
+    metrics = None
+    landmark_count = 0
+
+    def start(self, fps):
+        """Called once before the first frame with the source frame rate."""
+
+    def process(self, frame_index, frame, frame_rgb):
+        """Consumes one decoded frame (BGR) and its RGB conversion."""
+        raise NotImplementedError
+
+    def warmup(self, frame_index, frame, frame_rgb):
+        """Primes tracking state on a frame that must not be counted (shard overlap)."""
+
+    def result(self):
+        """Returns the aggregated result after the last frame."""
+        raise NotImplementedError
+
+    @staticmethod
+    def merge(parts):
+        """Combines results of consecutive time shards, in order, into one result."""
+        raise NotImplementedError
+
+    def close(self):
+        """Releases any model resources held by the analyzer."""
+
+    def observe(self, stage, seconds):
+        """Records ``<name>.<stage>`` timing when the run is instrumented."""
+        if self.metrics is not None:
+            self.metrics.observe(f"{self.name}.{stage}", seconds)
+
+
+def merge_ratio(parts):
+    """Merges ``(score, hits, total, sampled)`` shard results into one percentage result."""
+    hits = sum(part[1] for part in parts)
+    total = sum(part[2] for part in parts)
+    sampled = sum(part[3] for part in parts)
+    return (hits / total) * 100 if total > 0 else 0, hits, total, sampled
+
+
+class LabelAnalyzer(FrameAnalyzer):
+    """Analyzer that assigns one label to every frame from its landmarks.
+
+    Inference only runs on frames picked by the sampling policy (a
+    SamplingPolicy keyword dict, default every frame); skipped frames inherit
+    the last inferred label, so counts still cover every frame. ``preprocess``
+    is a FramePreprocessor keyword dict that downscales and ROI-crops the
+    model input (default full resolution). MediaPipe graphs are checked out
+    of a shared pool with checkout() and returned, reset, on close().
+
+    detect() turns a frame into a ``(landmark_count, 3)`` array of full-frame
+    landmarks. The arrays are gathered ``chunk_frames`` at a time and labelled
+    by the vectorized rules in interviewly.scoring, so no per-frame Python
+    scoring runs. With ``record_landmarks`` they are also kept (as float16)
+    for the landmark store, see recording().
+    """
+    chunk_frames = 256
+
+    def __init__(self, sampling=None, preprocess=None, record_landmarks=False):
+        self.sampling = SamplingPolicy(**(sampling or {}))
+        self.preprocessor = FramePreprocessor(**preprocess) if preprocess else None
+        self.record_landmarks = record_landmarks
+        self.chunk = np.full((self.chunk_frames, self.landmark_count, 3), np.nan, dtype=np.float32)
+        self.chunk_size = 0
+        self.sampled = []  # indices of the inferred frames
+        self.sample_labels = []
+        self.recorded_points = []
+        self.first_frame = None
+        self.total_frames = 0
+        self.inference_seconds = 0.0
+        self.graphs = []
+
+    def checkout(self, solution, **options):
+        """Takes a MediaPipe graph from the process-wide pool for the lifetime of this analyzer."""
+        pool = graph_pool(solution, **options)
+        graph = pool.acquire()
+        self.graphs.append((pool, graph))
+        return graph
+
+    def close(self):
+        while self.graphs:
+            pool, graph = self.graphs.pop()
+            pool.release(graph)
+
+    def start(self, fps):
+        self.sampling.start(fps)
+
+    def detect(self, frame_rgb):
+        """Runs inference on one RGB frame; returns its full-frame landmarks as an array, or None."""
+        raise NotImplementedError
+
+    def label(self, points):
+        """Vectorized rule: one label per frame of a ``(frames, landmark_count, 3)`` array."""
+        raise NotImplementedError
+
+    def infer(self, model, image):
+        """Runs a MediaPipe graph on the model input, timing the forward pass alone."""
+        started = time.perf_counter()
+        results = model.process(image)
+        self.inference_seconds = time.perf_counter() - started
+        return results
+
+    def prepare(self, frame_rgb):
+        """Returns the model input for a frame and the transform needed to map landmarks back."""
+        if self.preprocessor is None:
+            return frame_rgb, None
+        return self.preprocessor.prepare(frame_rgb)
+
+    def to_frame(self, landmarks, transform):
+        """Converts model landmarks to full-frame normalized ``(n, 3)`` points and updates the ROI."""
+        points = as_points(landmarks)
+        if self.preprocessor is None:
+            return points
+        return self.preprocessor.to_frame(points, transform)
+
+    def lost(self):
+        """Called when the model found no subject, so the next frame is searched in full."""
+        if self.preprocessor is not None:
+            self.preprocessor.reset()
+
+    def process(self, frame_index, frame, frame_rgb):
+        if self.first_frame is None:
+            self.first_frame = frame_index
+        # Always infer the first frame so a shard never starts on the default label
+        if self.sampling.should_sample(frame_index, frame) or not self.sampled:
+            started = time.perf_counter()
+            points = self.detect(frame_rgb)
+            if self.metrics is not None:
+                # Postprocess covers everything around the model: ROI prep and landmark conversion
+                self.observe("inference", self.inference_seconds)
+                self.observe("postprocess", time.perf_counter() - started - self.inference_seconds)
+
+            slot = self.chunk[self.chunk_size]
+            slot.fill(np.nan)
+            if points is not None:
+                slot[:len(points)] = points[:self.landmark_count]
+            self.sampled.append(frame_index)
+            self.chunk_size += 1
+            if self.chunk_size == self.chunk_frames:
+                self.flush()
+        self.total_frames += 1
+
+    def flush(self):
+        """Labels the gathered landmarks with one vectorized rule call."""
+        if not self.chunk_size:
+            return
+        started = time.perf_counter()
+        points = self.chunk[:self.chunk_size]
+        self.sample_labels.append(self.label(points))
+        if self.record_landmarks:
+            self.recorded_points.append(points.astype(LANDMARK_DTYPE))
+        self.chunk_size = 0
+        self.observe("scoring", time.perf_counter() - started)
+
+    def warmup(self, frame_index, frame, frame_rgb):
+        self.detect(frame_rgb)
+
+    def label_frame(self, frame_rgb):
+        """Detects and labels one frame right away, bypassing sampling and chunking (live mode)."""
+        points = np.full((1, self.landmark_count, 3), np.nan, dtype=np.float32)
+        detected = self.detect(frame_rgb)
+        if detected is not None:
+            points[0, :len(detected)] = detected[:self.landmark_count]
+        return self.label(points)[0]
+
+    def labelled_frames(self):
+        """Returns the labels of the inferred frames and how many frames each one covers."""
+        self.flush()
+        labels = np.concatenate(self.sample_labels) if self.sample_labels else np.zeros(0, dtype=np.intp)
+        end_frame = (self.first_frame or 0) + self.total_frames
+        return labels, frame_weights(self.sampled, end_frame)
+
+    def recording(self):
+        """Returns the recorded landmarks as ``{"frames", "points", "end_frame"}``, or None.
+
+        ``frames`` holds the indices of the inferred frames; every frame up to
+        the next inferred one (or ``end_frame``) shares its label.
+        """
+        self.flush()
+        if not self.record_landmarks or not self.recorded_points:
+            return None
+        return {
+            "frames": np.asarray(self.sampled, dtype=np.int32),
+            "points": np.concatenate(self.recorded_points),
+            "end_frame": self.first_frame + self.total_frames,
+        }
+
+
+# --- Eye Contact ---
+class EyeContactAnalyzer(LabelAnalyzer):
+    """Counts frames where both eyes are centered on the nose."""
+    name = "eyecontact"
+    version = ANALYZER_VERSIONS[name]
+    result_params = ("threshold", "sampling", "preprocess")
+    landmark_count = FACE_POINTS
+
+    def __init__(self, threshold=0.05, sampling=None, preprocess=None, record_landmarks=False):
+        super().__init__(sampling, preprocess, record_landmarks)
+        self.threshold = threshold
+        self.face_mesh = self.checkout(mp_face_mesh.FaceMesh, static_image_mode=False, max_num_faces=1,
+                                       min_detection_confidence=0.5)
+
+    def detect(self, frame_rgb):
+        image, transform = self.prepare(frame_rgb)
+        results = self.infer(self.face_mesh, image)
+
+        if results.multi_face_landmarks:
+            return self.to_frame(results.multi_face_landmarks[0].landmark, transform)
+        self.lost()
+        return None
+
+    def label(self, points):
+        # Eyes centered on the nose: looking straight at the camera
+        return eye_contact_labels(points, self.threshold)
+
+    def result(self):
+        return ratio_score(*self.labelled_frames())
+
+    merge = staticmethod(merge_ratio)
+
+
+# --- Posture ---
+class PostureAnalyzer(LabelAnalyzer):
+    """Counts frames where shoulders and hips are level."""
+    name = "posture"
+    version = ANALYZER_VERSIONS[name]
+    result_params = ("threshold", "sampling", "preprocess")
+    landmark_count = POSE_POINTS
+
+    def __init__(self, threshold=0.05, sampling=None, preprocess=None, record_landmarks=False):
+        super().__init__(sampling, preprocess, record_landmarks)
+        self.threshold = threshold
+        self.pose = self.checkout(mp_pose.Pose, static_image_mode=False, min_detection_confidence=0.5,
+                                  min_tracking_confidence=0.5)
+
+    def detect(self, frame_rgb):
+        image, transform = self.prepare(frame_rgb)
+        results = self.infer(self.pose, image)
+
+        if results.pose_landmarks:
+            return self.to_frame(results.pose_landmarks.landmark, transform)
+        self.lost()
+        return None
+
+    def label(self, points):
+        # Shoulder and hip alignment
+        return posture_labels(points, self.threshold)
+
+    def result(self):
+        return ratio_score(*self.labelled_frames())
+
+    merge = staticmethod(merge_ratio)
+
+
+# --- Gestures ---
+class GestureAnalyzer(LabelAnalyzer):
+    """Tallies one gesture per frame from up to two hands.
+
+    The first detected hand decides; when it shows no recognized gesture the
+    second hand's gesture is used.
+    """
+    name = "gesture"
+    version = ANALYZER_VERSIONS[name]
+    result_params = ("sampling", "preprocess")
+    landmark_count = MAX_HANDS * HAND_POINTS  # hands one after another, first detected hand first
+
+    def __init__(self, sampling=None, preprocess=None, record_landmarks=False):
+        super().__init__(sampling, preprocess, record_landmarks)
+        self.hands = self.checkout(mp_hands.Hands, static_image_mode=False, max_num_hands=MAX_HANDS,
+                                   min_detection_confidence=0.5)
+
+    def detect(self, frame_rgb):
+        image, transform = self.prepare(frame_rgb)
+        results = self.infer(self.hands, image)
+
+        if results.multi_hand_landmarks:
+            # The ROI follows all hands together
+            hands = [landmark for hand in results.multi_hand_landmarks[:MAX_HANDS] for landmark in hand.landmark]
+            return self.to_frame(hands, transform)
+        self.lost()
+        return None
+
+    def label(self, points):
+        return gesture_labels(points)
+
+    def result(self):
+        """Returns ``(gesture_counts, sampled_frames)``."""
+        return gesture_score(*self.labelled_frames())
+
+    @staticmethod
+    def merge(parts):
+        counts = {gesture: sum(part[0][gesture] for part in parts) for gesture in GESTURES}
+        return counts, sum(part[1] for part in parts)
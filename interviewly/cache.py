@@ -0,0 +1,136 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.environ.get("INTERVIEWLY_CACHE_DIR", os.path.join(".cache", "results"))
+CACHE_MAX_BYTES = int(os.environ.get("INTERVIEWLY_CACHE_MAX_MB", "256")) * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Result versions of the analyzers: bump when a model or scoring rule changes.
+# Kept here, free of model imports, so job keys can include them cheaply.
+ANALYZER_VERSIONS = {
+    "eyecontact": "2",
+    "posture": "2",
+    "gesture": "3",
+    "emotion": "3",
+}
+
+_file_hashes = {}  # abspath -> ((size, mtime), sha256); one entry per path, replaced when the file changes
+
+
+# --- Content Hashing ---
+def hash_file(path):
+    """Returns the SHA-256 of a file, memoized on (path, size, mtime)."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    memo = _file_hashes.get(path)
+    if memo is None or memo[0] != (stat.st_size, stat.st_mtime):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        memo = _file_hashes[path] = ((stat.st_size, stat.st_mtime), digest.hexdigest())
+    return memo[1]
+
+
+def remember_hash(path, digest):
+    """Records a hash computed elsewhere (e.g. while streaming an upload)."""
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    _file_hashes[path] = ((stat.st_size, stat.st_mtime), digest)
+
+
+def cache_key(video_hash, analyzer, version, params):
+    """Builds a stable key from the video content, analyzer identity and its thresholds."""
+    payload = json.dumps([video_hash, analyzer, version, params], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# --- Disk-Backed LRU Cache ---
+class ResultCache:
+    """Stores JSON-serializable analysis results on disk with size-bounded LRU eviction.
+
+    Recency is tracked through file mtimes, which are bumped on every hit, so
+    the cache survives restarts and is shared by every session on the host.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Returns the cached result or None on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+    def put(self, key, value):
+        """Stores a result atomically and evicts least recently used entries."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Deletes the oldest entries until the cache fits in max_bytes."""
+        with self.lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+
+    def clear(self):
+        """Removes every cached result."""
+        for name in os.listdir(self.cache_dir):
+            self._remove(os.path.join(self.cache_dir, name))
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+_default_cache = None
+
+
+def get_cache():
+    """Returns the process-wide result cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
@@ -0,0 +1,39 @@
+"""Result charts rendered once per distinct result and served as PNG bytes.
+
+Charts are drawn on standalone ``matplotlib.figure.Figure`` objects, which
+never enter pyplot's global figure registry, and are released right after
+rendering. The PNG is cached on the chart's content, so Streamlit reruns and
+other sessions showing the same result do not draw again.
+"""
+import io
+import os
+from collections import Counter
+from functools import lru_cache
+
+from matplotlib.figure import Figure
+
+CHART_CACHE_SIZE = int(os.environ.get("INTERVIEWLY_CHART_CACHE_SIZE", "256"))
+
+
+def count_labels(labels):
+    """Counts labels in one pass; returns ``[(label, count)]`` most common first."""
+    return Counter(labels).most_common()
+
+
+@lru_cache(maxsize=CHART_CACHE_SIZE)
+def _render_pie(labels, values, colors, title, size):
+    figure = Figure(figsize=(size, size))
+    try:
+        axes = figure.subplots()
+        axes.pie(values, labels=labels, autopct='%1.1f%%', colors=colors or None)
+        axes.set_title(title)
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format="png", bbox_inches="tight")
+        return buffer.getvalue()
+    finally:
+        figure.clear()
+
+
+def pie_chart(labels, values, colors=(), title="", size=6):
+    """Returns a pie chart as PNG bytes, rendered only the first time these values are seen."""
+    return _render_pie(tuple(labels), tuple(values), tuple(colors), title, size)
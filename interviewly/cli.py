@@ -0,0 +1,283 @@
+"""Headless batch analyzer for directories of recorded interviews.
+
+    python -m interviewly batch recordings/ --output results/ --concurrency 4
+    python -m interviewly batch manifest.txt --output results/ --skip-speech
+    python -m interviewly rescore interview.mp4 --analyzer posture --threshold 0.08
+    python -m interviewly compare interview.mp4 --preprocess fast
+    python -m interviewly storage --clean
+    python -m interviewly live --camera 0
+    python -m interviewly live --replay interview.mp4 --budget-ms 100
+
+Writes one JSON result per video plus ``summary.json``. Videos whose result
+file already exists are skipped, so an interrupted overnight run can resume.
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+
+from interviewly.cache import hash_file
+from interviewly.metrics import StageMetrics
+
+logger = logging.getLogger(__name__)
+
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".avi", ".mkv")
+
+
+# --- Inputs ---
+def find_videos(source):
+    """Returns video paths from a directory (recursive) or a manifest file.
+
+    A manifest is either a JSON list of paths or a text file with one path per
+    line; relative paths are resolved against the manifest's directory.
+    """
+    if os.path.isdir(source):
+        videos = []
+        for root, _, files in os.walk(source):
+            videos.extend(os.path.join(root, name) for name in files if name.lower().endswith(VIDEO_EXTENSIONS))
+        return sorted(videos)
+
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source, encoding="utf-8") as f:
+        content = f.read()
+    if source.lower().endswith(".json"):
+        entries = json.loads(content)
+    else:
+        entries = [line.strip() for line in content.splitlines() if line.strip() and not line.startswith("#")]
+    return [entry if os.path.isabs(entry) else os.path.join(base, entry) for entry in entries]
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def result_path(output_dir, video_path, video_hash):
+    stem = os.path.splitext(os.path.basename(video_path))[0]
+    return os.path.join(output_dir, f"{stem}-{video_hash[:12]}.json")
+
+
+# --- Per-Video Analysis ---
+def analyze_one(video_path, output_path, video_hash, skip_vision=False, skip_speech=False, profile=None,
+                shard_workers=1, speech_cpus=None, track_faces=None):
+    """Runs the page analyzers on one video and writes its JSON result (worker process entry point).
+
+    ``speech_cpus`` bounds the transcription processes this video may start;
+    ``track_faces`` overrides INTERVIEWLY_TRACK_FACES for the emotion analyzer.
+    """
+    started = time.perf_counter()
+    result = {"video": os.path.abspath(video_path), "sha256": video_hash}
+    metrics = StageMetrics()
+
+    if not skip_vision:
+        from interviewly.pipeline import analyze_video
+
+        params = {"emotion": {"track_faces": track_faces}} if track_faces is not None else None
+        result["vision"] = analyze_video(video_path, params=params, workers=shard_workers, metrics=metrics)
+
+    if not skip_speech:
+        from interviewly.sentiment import analyze_speech
+
+        try:
+            result["speech"] = analyze_speech(video_path, profile, metrics=metrics, cpus=speech_cpus)
+        except Exception as e:
+            # A silent recording should not lose its vision results
+            result["speech"] = {"error": str(e)}
+
+    result["seconds"] = time.perf_counter() - started
+    metrics.observe("total", result["seconds"])
+    metrics.export("batch")
+    result["performance"] = metrics.summary()
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    os.replace(tmp_path, output_path)
+    return result
+
+
+def summarize(result):
+    """Flattens one video's result into the headline numbers shown on the pages."""
+    row = {"video": result["video"], "seconds": round(result.get("seconds", 0), 1)}
+    vision = result.get("vision") or {}
+    if "eyecontact" in vision:
+        row["eye_contact_score"] = vision["eyecontact"][0]
+    if "posture" in vision:
+        row["posture_score"] = vision["posture"][0]
+    if "gesture" in vision:
+        counts = vision["gesture"][0]
+        row["most_common_gesture"] = max(counts, key=counts.get)
+    if vision.get("emotion"):
+        row["dominant_emotion"] = Counter(vision["emotion"]).most_common(1)[0][0]
+
+    speech = result.get("speech") or {}
+    if "analysis" in speech:
+        analysis = speech["analysis"]
+        row["sentiment"] = analysis["Sentiment"]
+        row["sentiment_score"] = analysis["Sentiment Score"]
+        row["filler_count"] = analysis["Hesitation Count"]
+        row["fillers_per_minute"] = analysis.get("Fillers Per Minute")
+    elif "error" in speech:
+        row["speech_error"] = speech["error"]
+    return row
+
+
+# --- Batch Runner ---
+def run_batch(source, output_dir, concurrency=2, force=False, **options):
+    """Analyzes every video from ``source`` across a process pool; returns the summary dict."""
+    os.makedirs(output_dir, exist_ok=True)
+    # Each video gets its share of the cores, so --concurrency bounds the Whisper models loaded at once
+    options.setdefault("speech_cpus", max(1, (os.cpu_count() or 1) // concurrency))
+    videos = find_videos(source)
+    rows = []
+    failures = []
+    pending = {}
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=concurrency, mp_context=context) as executor:
+        for video_path in videos:
+            try:
+                video_hash = hash_file(video_path)
+            except OSError as e:
+                failures.append({"video": video_path, "error": str(e)})
+                continue
+
+            output_path = result_path(output_dir, video_path, video_hash)
+            if os.path.exists(output_path) and not force:
+                with open(output_path, encoding="utf-8") as f:
+                    rows.append(summarize(json.load(f)))
+                continue
+            future = executor.submit(analyze_one, video_path, output_path, video_hash, **options)
+            pending[future] = video_path
+
+        for done, future in enumerate(as_completed(pending), 1):
+            video_path = pending[future]
+            try:
+                rows.append(summarize(future.result()))
+                logger.info(f"[{done}/{len(pending)}] {video_path}")
+            except Exception as e:
+                logger.error(f"[{done}/{len(pending)}] {video_path} failed: {e}")
+                failures.append({"video": video_path, "error": str(e)})
+
+    summary = {
+        "videos": len(videos),
+        "analyzed": len(rows),
+        "failed": len(failures),
+        "results": sorted(rows, key=lambda row: row["video"]),
+        "failures": failures,
+    }
+    with open(os.path.join(output_dir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m interviewly", description="InterviewLY headless tools.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch = subparsers.add_parser("batch", help="analyze a directory or manifest of interview videos")
+    batch.add_argument("source", help="directory of videos, or a manifest (.txt one path per line, or .json list)")
+    batch.add_argument("--output", "-o", default="results", help="directory for per-video JSON and summary.json")
+    batch.add_argument("--concurrency", "-j", type=positive_int, default=2, help="videos analyzed at the same time")
+    batch.add_argument("--shard-workers", type=positive_int, default=1, help="processes per video for long videos")
+    batch.add_argument("--profile", default=None, help="transcription profile (fast, balanced, accurate)")
+    batch.add_argument("--skip-vision", action="store_true", help="skip eye contact, posture, gesture and emotion")
+    batch.add_argument("--skip-speech", action="store_true", help="skip transcription and sentiment")
+    batch.add_argument("--track-faces", action="store_true", default=None,
+                       help="detect faces on keyframes only and track them in between (emotion)")
+    batch.add_argument("--force", action="store_true", help="re-analyze videos that already have a result")
+
+    rescore = subparsers.add_parser("rescore", help="re-score a video from its stored landmarks with a new threshold")
+    rescore.add_argument("video", help="video to re-score (landmarks are recorded on the first rescore and reused after)")
+    rescore.add_argument("--analyzer", choices=("eyecontact", "posture", "gesture"), default="eyecontact")
+    rescore.add_argument("--threshold", type=float, default=0.05, help="eye contact / posture threshold")
+
+    compare = subparsers.add_parser("compare", help="score changes and pixel savings of a preprocessing profile")
+    compare.add_argument("video", help="video to analyze at full resolution and with the profile")
+    compare.add_argument("--preprocess", choices=("balanced", "fast"), default="fast", help="preprocessing profile")
+    compare.add_argument("--analyzer", action="append", choices=("eyecontact", "posture", "gesture"),
+                         help="analyzer to compare (repeatable; default: all three)")
+
+    storage = subparsers.add_parser("storage", help="report disk usage of uploads, caches and scratch files")
+    storage.add_argument("--clean", action="store_true", help="sweep stale files and enforce quotas first")
+
+    live = subparsers.add_parser("live", help="score a webcam or a replayed video in real time")
+    source = live.add_mutually_exclusive_group(required=True)
+    source.add_argument("--camera", type=int, help="OpenCV camera index")
+    source.add_argument("--replay", help="video file replayed at wall-clock speed")
+    live.add_argument("--speed", type=float, default=1.0, help="replay speed multiplier")
+    live.add_argument("--duration", type=float, default=None, help="seconds to run (default: until the source ends)")
+    live.add_argument("--budget-ms", type=float, default=None, help="capture-to-score latency budget")
+    live.add_argument("--window", type=float, default=None, help="seconds covered by the rolling scores")
+    live.add_argument("--preprocess", default=None, help="preprocessing profile (full, balanced, fast)")
+    live.add_argument("--analyzer", action="append", choices=("eyecontact", "posture", "gesture"),
+                      help="analyzer to run (repeatable, default all)")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.command == "batch":
+        summary = run_batch(
+            args.source,
+            args.output,
+            concurrency=args.concurrency,
+            force=args.force,
+            skip_vision=args.skip_vision,
+            skip_speech=args.skip_speech,
+            profile=args.profile,
+            shard_workers=args.shard_workers,
+            track_faces=args.track_faces,
+        )
+        logger.info(f"Analyzed {summary['analyzed']} of {summary['videos']} videos, {summary['failed']} failed")
+        return 1 if summary["failed"] else 0
+
+    if args.command == "storage":
+        from interviewly.storage import get_storage_manager
+
+        manager = get_storage_manager()
+        print(json.dumps(manager.cleanup() if args.clean else manager.usage(), indent=2))
+        return 0
+
+    if args.command == "live":
+        from interviewly.live import CameraSource, ReplaySource, run_live
+
+        if args.replay:
+            source = ReplaySource(args.replay, speed=args.speed)
+        else:
+            source = CameraSource(args.camera)
+        options = {"on_update": lambda snapshot: print(json.dumps(snapshot), flush=True)}
+        if args.analyzer:
+            options["names"] = tuple(args.analyzer)
+        if args.budget_ms is not None:
+            options["budget_ms"] = args.budget_ms
+        if args.window is not None:
+            options["window_seconds"] = args.window
+        if args.preprocess is not None:
+            options["preprocess"] = args.preprocess
+        snapshot = run_live(source, args.duration, **options)
+        print(json.dumps(snapshot))
+        return 1 if snapshot["error"] else 0
+
+    if args.command == "rescore":
+        from interviewly.pipeline import rescore_video
+
+        print(json.dumps(rescore_video(args.video, args.analyzer, threshold=args.threshold)))
+        return 0
+
+    if args.command == "compare":
+        from interviewly.pipeline import compare_to_full_resolution
+
+        names = args.analyzer or ("eyecontact", "posture", "gesture")
+        print(json.dumps(compare_to_full_resolution(args.video, args.preprocess, names), indent=2))
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
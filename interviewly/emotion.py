@@ -0,0 +1,137 @@
+import os
+import time
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from interviewly.analyzers import FrameAnalyzer
+from interviewly.tracking import FaceTracker
+from interviewly.cache import ANALYZER_VERSIONS
+
+logger = logging.getLogger(__name__)
+
+NO_FACE = "No Face Detected"
+EMOTION_INPUT_SIZE = (48, 48)
+EMOTION_BATCH_SIZE = 32
+GRAY_WEIGHTS = np.array([0.114, 0.587, 0.299], dtype=np.float32)  # BGR luma, as cv2.COLOR_BGR2GRAY
+TRACK_FACES = os.environ.get("INTERVIEWLY_TRACK_FACES", "0") == "1"
+
+
+# --- Batched Emotion Inference ---
+def face_crop(frame, detector_backend="opencv"):
+    """Detects and aligns the first face in a BGR frame and returns a 48x48 float32 BGR crop in 0..1."""
+    from deepface.commons import functions
+
+    try:
+        img_objs = functions.extract_faces(
+            img=frame,
+            target_size=(224, 224),
+            detector_backend=detector_backend,
+            grayscale=False,
+            enforce_detection=False,
+            align=True
+        )
+        # extract_faces already pads the face and scales it to 0..1
+        return cv2.resize(img_objs[0][0][0], EMOTION_INPUT_SIZE).astype(np.float32)
+    except Exception as e:
+        logger.warning(f"Error extracting face: {e}")
+        return None
+
+
+def check_crops(batch):
+    """Rejects a crop batch that is not float and scaled to 0..1, which the classifier was trained on."""
+    if batch.dtype.kind != "f" or batch.min() < 0 or batch.max() > 1 + 1e-3:
+        raise ValueError(f"Face crops must be floats in 0..1, got {batch.dtype} in {batch.min()}..{batch.max()}")
+    return batch
+
+
+def classify_crops(crops):
+    """Runs the emotion classifier once over a batch of face crops (None = no face)."""
+    from deepface import DeepFace
+    from deepface.extendedmodels import Emotion
+
+    labels = [NO_FACE] * len(crops)
+    valid = [i for i, crop in enumerate(crops) if crop is not None]
+    if not valid:
+        return labels
+
+    batch = check_crops(np.stack([crops[i] for i in valid]))
+    gray = (batch @ GRAY_WEIGHTS)[..., np.newaxis]
+    predictions = DeepFace.build_model("Emotion").predict(gray, verbose=0)
+    for i, label_index in zip(valid, predictions.argmax(axis=1)):
+        labels[i] = Emotion.labels[label_index]
+    return labels
+
+
+class EmotionAnalyzer(FrameAnalyzer):
+    """Samples frames from the shared pipeline and classifies them in batches.
+
+    Face crops are extracted on a small thread pool as frames are decoded and
+    the classifier runs once per ``batch_size`` crops. At most ``max_pending``
+    frames are in flight so memory stays bounded on long videos.
+
+    With ``track_faces=True`` (default: INTERVIEWLY_TRACK_FACES=1) the detector
+    only runs on keyframes and the face box is tracked in between (see
+    FaceTracker), so the hot loop mostly skips detection. Tracking is
+    sequential and runs in the decode thread.
+    """
+    name = "emotion"
+    version = ANALYZER_VERSIONS[name]
+    result_params = ("frame_rate", "track_faces")
+
+    def __init__(self, frame_rate=5, batch_size=EMOTION_BATCH_SIZE, max_workers=4, max_pending=16, track_faces=TRACK_FACES):
+        self.frame_rate = frame_rate
+        self.tracker = FaceTracker() if track_faces else None
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.frame_interval = 1
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.pending = deque()
+        self.crops = []
+        self.emotions = []
+
+    def start(self, fps):
+        self.frame_interval = max(1, int(fps) // self.frame_rate)
+
+    def process(self, frame_index, frame, frame_rgb):
+        if frame_index % self.frame_interval != 0:
+            return
+        if self.tracker:
+            self._add_crop(self.tracker.crop(frame, EMOTION_INPUT_SIZE))
+            return
+        self.pending.append(self.executor.submit(face_crop, frame))
+        while len(self.pending) > self.max_pending:
+            self._add_crop(self.pending.popleft().result())
+
+    def _add_crop(self, crop):
+        self.crops.append(crop)
+        if len(self.crops) >= self.batch_size:
+            self._classify()
+
+    def _classify(self):
+        if not self.crops:
+            return
+        started = time.perf_counter()
+        self.emotions.extend(classify_crops(self.crops))
+        self.observe("inference", time.perf_counter() - started)
+        self.crops = []
+
+    def result(self):
+        while self.pending:
+            self._add_crop(self.pending.popleft().result())
+        self._classify()
+        return list(self.emotions)
+
+    def warmup(self, frame_index, frame, frame_rgb):
+        if self.tracker:
+            self.tracker.update(frame)
+
+    @staticmethod
+    def merge(parts):
+        return [emotion for part in parts for emotion in part]
+
+    def close(self):
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,141 @@
+import os
+import re
+import json
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r"[\w']+")
+
+# Per-language filler lexicons; phrases are matched on whole words, case-insensitively
+FILLER_LEXICONS = {
+    "en": ["uh", "um", "like", "you know", "so", "actually", "basically"],
+}
+LEXICON_PATH = os.environ.get("INTERVIEWLY_FILLER_LEXICON")
+
+
+def load_lexicons(path=LEXICON_PATH):
+    """Returns the built-in lexicons, extended/overridden by a ``{language: [phrases]}`` JSON file."""
+    lexicons = dict(FILLER_LEXICONS)
+    if path:
+        with open(path, encoding="utf-8") as f:
+            lexicons.update(json.load(f))
+    return lexicons
+
+
+def tokenize(text):
+    """Splits text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+# --- Single-Pass Filler Scanner ---
+class FillerScanner:
+    """Finds every filler phrase in one left-to-right pass over the words.
+
+    Phrases are compiled once into a word trie. At each word the scanner walks
+    the trie as far as the following words allow and takes the longest match,
+    so the cost is linear in transcript length times the longest phrase (a
+    small constant) regardless of lexicon size.
+    """
+
+    def __init__(self, phrases):
+        self.trie = {}
+        self.longest = 1  # tokens in the longest phrase: the most a match can look ahead
+        for phrase in phrases:
+            node = self.trie
+            tokens = tokenize(phrase)
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[None] = phrase
+            self.longest = max(self.longest, len(tokens))
+
+    @classmethod
+    def for_language(cls, language="en"):
+        """Builds a scanner for a configured language lexicon."""
+        lexicons = load_lexicons()
+        if language not in lexicons:
+            raise ValueError(f"No filler lexicon for language: {language!r} (configured: {', '.join(sorted(lexicons))})")
+        return cls(lexicons[language])
+
+    def tokens(self, words):
+        """Splits ``(word, start, end)`` tuples into ``(token, start, end)`` tuples."""
+        return [(token, start, end) for word, start, end in words for token in tokenize(word)]
+
+    def match(self, tokens, i):
+        """Returns ``(phrase, j)`` for the longest phrase at ``tokens[i:j]``, or None."""
+        node = self.trie
+        match = None
+        j = i
+        while j < len(tokens) and tokens[j][0] in node:
+            node = node[tokens[j][0]]
+            j += 1
+            if None in node:
+                match = (node[None], j)
+        return match
+
+    def scan(self, words):
+        """Scans ``(word, start, end)`` tuples and returns ``[(phrase, start, end)]`` matches.
+
+        ``start``/``end`` are whatever position the caller uses, e.g. Whisper
+        word timestamps in seconds.
+        """
+        return self.matches(self.tokens(words))
+
+    def matches(self, tokens):
+        """Scans ``(token, start, end)`` tuples left to right, taking the longest match at each token."""
+        matches = []
+        i = 0
+        while i < len(tokens):
+            match = self.match(tokens, i)
+            if match:
+                phrase, j = match
+                matches.append((phrase, tokens[i][1], tokens[j - 1][2]))
+                i = j
+            else:
+                i += 1
+        return matches
+
+    def report(self, words, duration_seconds=None):
+        """Returns counts, positions and per-minute filler rates for timestamped words."""
+        words = list(words)
+        matches = self.scan(words)
+        counts = Counter(phrase for phrase, _, _ in matches)
+        if duration_seconds is None and words:
+            duration_seconds = words[-1][2] - words[0][1]
+        minutes = duration_seconds / 60 if duration_seconds else 0
+        return {
+            "total": len(matches),
+            "counts": dict(counts),
+            "positions": matches,
+            "per_minute": len(matches) / minutes if minutes else 0.0,
+            "per_minute_by_filler": {phrase: count / minutes for phrase, count in counts.items()} if minutes else {},
+        }
+
+
+class FillerStream:
+    """Running filler count over words that arrive in pieces, e.g. transcript segments.
+
+    A match starting at a token only reads the next ``scanner.longest``
+    tokens, so matches with that much lookahead are settled and their tokens
+    dropped; the short tail is rescanned with the next piece. Phrases spanning
+    two pieces are therefore counted, and the count always equals a scan of
+    all words so far.
+    """
+
+    def __init__(self, scanner):
+        self.scanner = scanner
+        self.pending = []
+        self.settled = 0
+
+    def add(self, words):
+        """Adds the next words and returns the filler count so far."""
+        self.pending.extend(self.scanner.tokens(words))
+        i = 0
+        while i <= len(self.pending) - self.scanner.longest:
+            match = self.scanner.match(self.pending, i)
+            if match:
+                self.settled += 1
+                i = match[1]
+            else:
+                i += 1
+        del self.pending[:i]
+        # The tail's matches may still grow into the next piece, so they are counted but not settled
+        return self.settled + len(self.scanner.matches(self.pending))
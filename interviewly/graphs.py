@@ -0,0 +1,78 @@
+"""Bounded, thread-safe pools of MediaPipe graphs.
+
+Building a FaceMesh, Pose or Hands graph costs hundreds of milliseconds, and a
+graph carries tracking state from one frame to the next, so it must never be
+shared by two analyses at once. Each distinct graph configuration gets its own
+pool: an analysis checks a graph out, owns it exclusively, and the graph is
+reset (tracking state cleared) when it is returned for the next video.
+"""
+import os
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+GRAPH_POOL_SIZE = int(os.environ.get("INTERVIEWLY_GRAPH_POOL_SIZE", os.cpu_count() or 1))
+CHECKOUT_TIMEOUT_SECONDS = 600
+
+
+class GraphPool:
+    """Hands out up to ``size`` graphs built by ``factory``; callers beyond that wait.
+
+    Graphs are created lazily and idle ones are reused last-in first-out, so
+    the warmest graph serves the next analysis.
+    """
+
+    def __init__(self, factory, size=GRAPH_POOL_SIZE):
+        self.factory = factory
+        self.size = max(1, size)
+        self.idle = []
+        self.created = 0
+        self.condition = threading.Condition()
+
+    def acquire(self, timeout=CHECKOUT_TIMEOUT_SECONDS):
+        """Returns an idle graph, builds a new one, or waits for one to be released."""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.idle or self.created < self.size, timeout):
+                raise TimeoutError(f"No MediaPipe graph became available within {timeout}s")
+            if self.idle:
+                return self.idle.pop()
+            self.created += 1
+
+        try:
+            return self.factory()
+        except Exception:
+            with self.condition:
+                self.created -= 1
+                self.condition.notify()
+            raise
+
+    def release(self, graph):
+        """Resets the graph's tracking state and returns it to the pool."""
+        try:
+            graph.reset()
+        except Exception as e:
+            # A graph that cannot be reset is discarded so its state never leaks
+            logger.warning(f"Discarding MediaPipe graph that failed to reset: {e}")
+            with self.condition:
+                self.created -= 1
+                self.condition.notify()
+            graph.close()
+            return
+        with self.condition:
+            self.idle.append(graph)
+            self.condition.notify()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def graph_pool(solution, **options):
+    """Returns the process-wide pool for a MediaPipe solution class and its options."""
+    key = (solution, tuple(sorted(options.items())))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = GraphPool(lambda: solution(**options))
+        return pool
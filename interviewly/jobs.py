@@ -0,0 +1,465 @@
+"""Local background job queue for the heavy analysis steps.
+
+Jobs and their progress live in a SQLite database, so they survive page
+switches, browser refreshes and server restarts. Worker processes are started
+detached from the Streamlit server and claim queued jobs one at a time:
+
+    python -m interviewly.jobs worker
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import hashlib
+import logging
+import sqlite3
+import argparse
+import threading
+import subprocess
+from contextlib import contextmanager
+
+from interviewly.metrics import StageMetrics
+from interviewly.cache import ANALYZER_VERSIONS, hash_file
+
+logger = logging.getLogger(__name__)
+
+JOBS_DB = os.environ.get("INTERVIEWLY_JOBS_DB", os.path.join(".cache", "jobs.sqlite3"))
+JOB_WORKERS = int(os.environ.get("INTERVIEWLY_JOB_WORKERS", "2"))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER_LOG = os.path.join(".cache", "worker.log")
+HEARTBEAT_SECONDS = 5
+STALE_SECONDS = 30
+JOB_RETENTION_SECONDS = int(os.environ.get("INTERVIEWLY_JOB_RETENTION_DAYS", "7")) * 24 * 60 * 60
+CLEANUP_INTERVAL_SECONDS = 60 * 60
+PROGRESS_INTERVAL_SECONDS = 1.0
+FINGERPRINT_CHECK_SECONDS = 30  # how often an idle worker checks whether its code is outdated
+MAX_JOB_ATTEMPTS = int(os.environ.get("INTERVIEWLY_JOB_MAX_ATTEMPTS", "3"))  # worker crashes before a job fails
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    partial TEXT,
+    result TEXT,
+    error TEXT,
+    worker TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, created);
+CREATE TABLE IF NOT EXISTS workers (
+    id TEXT PRIMARY KEY,
+    pid INTEGER NOT NULL,
+    heartbeat REAL NOT NULL,
+    fingerprint TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS warmup (
+    worker TEXT NOT NULL,
+    model TEXT NOT NULL,
+    state TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (worker, model)
+);
+"""
+# Columns added after the first release: (table, column, definition)
+MIGRATIONS = (
+    ("jobs", "attempts", "INTEGER NOT NULL DEFAULT 0"),
+    ("workers", "fingerprint", "TEXT NOT NULL DEFAULT ''"),
+)
+
+
+# --- Job Handlers ---
+def run_video_job(payload, reporter):
+    """Runs the fused vision analyzers over a video; stage timings go under ``performance``."""
+    from interviewly.pipeline import analyze_video
+
+    metrics = StageMetrics()
+    with metrics.timer("total"):
+        # Like speech jobs, a video job shards over its share of the cores only
+        result = analyze_video(
+            payload["video_path"],
+            payload.get("names"),
+            params=payload.get("params"),
+            workers=max(1, (os.cpu_count() or 1) // JOB_WORKERS),
+            progress=reporter.progress,
+            metrics=metrics
+        )
+    metrics.export("video")
+    result["performance"] = metrics.summary()
+    return result
+
+
+def run_speech_job(payload, reporter):
+    """Transcribes a video's audio and scores sentiment and fillers, publishing partial transcripts."""
+    from interviewly.sentiment import analyze_speech, running_polarity
+
+    def on_segment(state):
+        if reporter.due():
+            state["sentiment"] = running_polarity(state["transcript"])
+            reporter.progress(state["seconds"] / state["duration"] if state["duration"] else 0, state, force=True)
+
+    metrics = StageMetrics()
+    with metrics.timer("total"):
+        # Workers run side by side, so each job transcribes on its share of the cores
+        result = analyze_speech(payload["video_path"], payload.get("profile"), on_segment=on_segment, metrics=metrics,
+                                cpus=max(1, (os.cpu_count() or 1) // JOB_WORKERS))
+    metrics.export("speech")
+    result["performance"] = metrics.summary()
+    return result
+
+
+JOB_HANDLERS = {
+    "video": run_video_job,
+    "speech": run_speech_job,
+}
+
+
+# --- Job Store ---
+class JobQueue:
+    """SQLite-backed job store shared by the Streamlit sessions and the workers.
+
+    Submitting the same kind and payload twice returns the existing job, so
+    reruns and concurrent sessions never duplicate work. The payload is keyed
+    together with the video's content hash and, for vision jobs, the analyzer
+    versions, so a changed file or a rule change runs the job again. Jobs held
+    by a worker whose heartbeat goes stale are put back in the queue, up to
+    ``MAX_JOB_ATTEMPTS`` claims, after which a job that keeps killing its
+    worker is failed instead of crash-looping.
+    """
+
+    def __init__(self, path=JOBS_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as db:
+            db.executescript(SCHEMA)
+            for table, column, definition in MIGRATIONS:
+                columns = {row["name"] for row in db.execute(f"PRAGMA table_info({table})")}
+                if column not in columns:
+                    try:
+                        db.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                    except sqlite3.OperationalError:
+                        pass  # another process added it first
+
+    @contextmanager
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            db.row_factory = sqlite3.Row
+            db.execute("PRAGMA journal_mode=WAL")
+            yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def identify(kind, payload):
+        """Returns the payload with what its result depends on besides the path: content hash and analyzer versions."""
+        payload = dict(payload)
+        if payload.get("video_path"):
+            payload["sha256"] = hash_file(payload["video_path"])
+        if kind == "video":
+            payload["versions"] = ANALYZER_VERSIONS
+        return payload
+
+    @staticmethod
+    def job_key(kind, payload):
+        return hashlib.sha256(json.dumps([kind, payload], sort_keys=True).encode("utf-8")).hexdigest()
+
+    def submit(self, kind, payload):
+        """Queues a job (or returns the id of an identical existing one) and returns its id."""
+        if kind not in JOB_HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        payload = self.identify(kind, payload)
+        key = self.job_key(kind, payload)
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR IGNORE INTO jobs (id, kind, key, payload, state, created, updated) "
+                "VALUES (?, ?, ?, ?, 'queued', ?, ?)",
+                (uuid.uuid4().hex, kind, key, json.dumps(payload), now, now)
+            )
+            # A failed job is retried when it is submitted again
+            db.execute(
+                "UPDATE jobs SET state = 'queued', progress = 0, error = NULL, attempts = 0, updated = ? "
+                "WHERE key = ? AND state = 'failed'",
+                (now, key)
+            )
+            return db.execute("SELECT id FROM jobs WHERE key = ?", (key,)).fetchone()["id"]
+
+    def get(self, job_id):
+        """Returns the job as a dict (payload, partial and result decoded), or None."""
+        with self._connect() as db:
+            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        for field in ("payload", "partial", "result"):
+            job[field] = json.loads(job[field]) if job[field] is not None else None
+        return job
+
+    def claim(self, worker_id):
+        """Atomically moves the oldest queued job to running for this worker."""
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute("SELECT id FROM jobs WHERE state = 'queued' ORDER BY created LIMIT 1").fetchone()
+            if row is None:
+                db.execute("COMMIT")
+                return None
+            db.execute(
+                "UPDATE jobs SET state = 'running', worker = ?, attempts = attempts + 1, updated = ? WHERE id = ?",
+                (worker_id, time.time(), row["id"])
+            )
+            db.execute("COMMIT")
+        return self.get(row["id"])
+
+    def update(self, job_id, progress, partial=None):
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET progress = ?, partial = COALESCE(?, partial), updated = ? WHERE id = ?",
+                (progress, json.dumps(partial) if partial is not None else None, time.time(), job_id)
+            )
+
+    def finish(self, job_id, result):
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET state = 'done', progress = 1, result = ?, updated = ? WHERE id = ?",
+                (json.dumps(result), time.time(), job_id)
+            )
+
+    def fail(self, job_id, error):
+        with self._connect() as db:
+            db.execute(
+                "UPDATE jobs SET state = 'failed', error = ?, updated = ? WHERE id = ?",
+                (error, time.time(), job_id)
+            )
+
+    def active_videos(self, recent_seconds=0):
+        """Returns the video paths of queued and running jobs, and of jobs finished in the last ``recent_seconds``."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT payload FROM jobs WHERE state IN ('queued', 'running') OR (state = 'done' AND updated > ?)",
+                (time.time() - recent_seconds,)
+            ).fetchall()
+        return {json.loads(row["payload"]).get("video_path") for row in rows} - {None}
+
+    def prune(self, max_age=JOB_RETENTION_SECONDS):
+        """Deletes finished and failed jobs not touched for ``max_age`` seconds."""
+        with self._connect() as db:
+            db.execute(
+                "DELETE FROM jobs WHERE state IN ('done', 'failed') AND updated < ?",
+                (time.time() - max_age,)
+            )
+
+    # --- Worker Registry ---
+    def heartbeat(self, worker_id, pid, fingerprint):
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO workers (id, pid, heartbeat, fingerprint) VALUES (?, ?, ?, ?)",
+                (worker_id, pid, time.time(), fingerprint)
+            )
+
+    def unregister(self, worker_id):
+        with self._connect() as db:
+            db.execute("DELETE FROM workers WHERE id = ?", (worker_id,))
+            db.execute("DELETE FROM warmup WHERE worker = ?", (worker_id,))
+
+    def set_warmup(self, worker_id, model, state):
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO warmup (worker, model, state, updated) VALUES (?, ?, ?, ?)",
+                (worker_id, model, state, time.time())
+            )
+
+    def warmup_status(self):
+        """Returns ``{model: state}`` over live workers; a model is ready once any worker has it ready."""
+        rank = {"ready": 2, "loading": 1, "failed": 0}
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT model, state FROM warmup WHERE worker IN (SELECT id FROM workers WHERE heartbeat > ?)",
+                (time.time() - STALE_SECONDS,)
+            ).fetchall()
+        status = {}
+        for row in rows:
+            if rank[row["state"]] > rank.get(status.get(row["model"]), -1):
+                status[row["model"]] = row["state"]
+        return status
+
+    def live_workers(self, fingerprint):
+        """Counts live workers running the code identified by ``fingerprint`` (see code_fingerprint)."""
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT COUNT(*) AS n FROM workers WHERE heartbeat > ? AND fingerprint = ?",
+                (time.time() - STALE_SECONDS, fingerprint)
+            ).fetchone()
+        return row["n"]
+
+    def requeue_stale(self, max_attempts=MAX_JOB_ATTEMPTS):
+        """Puts jobs of dead workers back in the queue, or fails them after ``max_attempts`` claims."""
+        cutoff = time.time() - STALE_SECONDS
+        with self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute(
+                "UPDATE jobs SET state = 'failed', worker = NULL, error = ?, updated = ? "
+                "WHERE state = 'running' AND attempts >= ? "
+                "AND worker NOT IN (SELECT id FROM workers WHERE heartbeat > ?)",
+                (f"The worker stopped {max_attempts} times while running this job", time.time(), max_attempts, cutoff)
+            )
+            db.execute(
+                "UPDATE jobs SET state = 'queued', worker = NULL, updated = ? "
+                "WHERE state = 'running' AND worker NOT IN (SELECT id FROM workers WHERE heartbeat > ?)",
+                (time.time(), cutoff)
+            )
+            db.execute("DELETE FROM warmup WHERE worker NOT IN (SELECT id FROM workers WHERE heartbeat > ?)", (cutoff,))
+            db.execute("DELETE FROM workers WHERE heartbeat <= ?", (cutoff,))
+            db.execute("COMMIT")
+
+
+class ProgressReporter:
+    """Throttles progress writes from a running job to about one per second."""
+
+    def __init__(self, queue, job_id, interval=PROGRESS_INTERVAL_SECONDS):
+        self.queue = queue
+        self.job_id = job_id
+        self.interval = interval
+        self.last_write = 0.0
+
+    def due(self):
+        return time.monotonic() - self.last_write >= self.interval
+
+    def progress(self, fraction, partial=None, force=False):
+        if force or self.due():
+            self.queue.update(self.job_id, fraction, partial)
+            self.last_write = time.monotonic()
+
+
+# --- Worker Process ---
+def worker_id_for(pid):
+    return f"{socket.gethostname()}-{pid}"
+
+
+def code_fingerprint():
+    """Hashes the package sources on disk and the analyzer versions.
+
+    A worker keeps the code it was started with, so after an upgrade its
+    fingerprint no longer matches the one on disk: it is not counted as a
+    live worker any more and exits once it is idle.
+    """
+    digest = hashlib.sha256(json.dumps(ANALYZER_VERSIONS, sort_keys=True).encode("utf-8"))
+    package = os.path.dirname(os.path.abspath(__file__))
+    for root, dirs, files in os.walk(package):
+        dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, package).encode("utf-8"))
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def run_worker(queue=None, poll_interval=1.0, warmup=True):
+    """Claims and runs jobs until the process is stopped.
+
+    With ``warmup`` the models are loaded on a background thread right away,
+    so the first job does not pay for them; jobs are claimed meanwhile. The
+    worker exits before claiming another job once the code on disk no longer
+    matches the code it runs (see code_fingerprint).
+    """
+    queue = queue or JobQueue()
+    worker_id = worker_id_for(os.getpid())
+    fingerprint = code_fingerprint()
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(HEARTBEAT_SECONDS):
+            queue.heartbeat(worker_id, os.getpid(), fingerprint)
+
+    queue.heartbeat(worker_id, os.getpid(), fingerprint)
+    threading.Thread(target=beat, daemon=True).start()
+    if warmup:
+        from interviewly.warmup import start_warmup
+
+        start_warmup(lambda model, state: queue.set_warmup(worker_id, model, state))
+    logger.info(f"Worker {worker_id} started")
+    last_cleanup = 0.0
+    last_check = time.monotonic()
+    try:
+        while True:
+            if time.monotonic() - last_check > FINGERPRINT_CHECK_SECONDS:
+                if code_fingerprint() != fingerprint:
+                    logger.info(f"Worker {worker_id} exiting: the code changed since it started")
+                    break
+                last_check = time.monotonic()
+            if time.monotonic() - last_cleanup > CLEANUP_INTERVAL_SECONDS:
+                from interviewly.storage import get_storage_manager
+
+                usage = get_storage_manager().cleanup()
+                logger.info(f"Disk usage after cleanup: {usage['total'] / 2 ** 20:.1f} MiB")
+                last_cleanup = time.monotonic()
+            queue.requeue_stale()
+            job = queue.claim(worker_id)
+            if job is None:
+                time.sleep(poll_interval)
+                continue
+
+            logger.info(f"Running {job['kind']} job {job['id']}")
+            try:
+                result = JOB_HANDLERS[job["kind"]](job["payload"], ProgressReporter(queue, job["id"]))
+                queue.finish(job["id"], result)
+            except Exception as e:
+                logger.exception(f"Job {job['id']} failed")
+                queue.fail(job["id"], str(e))
+    finally:
+        stop.set()
+        queue.unregister(worker_id)
+
+
+def ensure_workers(queue=None, count=JOB_WORKERS):
+    """Starts detached worker processes until ``count`` are alive.
+
+    Workers are registered before they start so concurrent sessions do not
+    over-spawn, and they keep running when the session that started them ends.
+    Only workers running the current code count, so an upgrade starts fresh
+    ones while the outdated workers finish their jobs and exit.
+    """
+    queue = queue or JobQueue()
+    fingerprint = code_fingerprint()
+    missing = count - queue.live_workers(fingerprint)
+    if missing <= 0:
+        return
+    os.makedirs(os.path.dirname(WORKER_LOG), exist_ok=True)
+    for _ in range(missing):
+        with open(WORKER_LOG, "ab") as log:
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [PROJECT_ROOT, os.environ.get("PYTHONPATH")])))
+            process = subprocess.Popen(
+                [sys.executable, "-m", "interviewly.jobs", "worker"],
+                env=env,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        queue.heartbeat(worker_id_for(process.pid), process.pid, fingerprint)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="InterviewLY background job worker.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    worker = subparsers.add_parser("worker", help="claim and run queued jobs")
+    worker.add_argument("--poll-interval", type=float, default=1.0)
+    worker.add_argument("--no-warmup", action="store_true", help="load models on first use instead of at start")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    if args.command == "worker":
+        run_worker(poll_interval=args.poll_interval, warmup=not args.no_warmup)
+
+
+if __name__ == "__main__":
+    main()
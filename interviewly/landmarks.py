@@ -0,0 +1,150 @@
+"""On-disk store of per-frame landmarks and vectorized re-scoring.
+
+The analyzers reduce every frame to one label; with recording enabled they
+also keep the landmarks behind it (see LabelAnalyzer.recording()). Those are
+stored here as ``.npy`` arrays keyed by video content and the settings that
+shape the landmarks (sampling, preprocessing) but not by the scoring rules,
+so new thresholds or rules (interviewly.scoring) can be applied to a video in
+milliseconds with ``rescore()`` instead of running inference again.
+"""
+import os
+import json
+import logging
+import threading
+
+import numpy as np
+
+from interviewly.cache import cache_key
+from interviewly.scoring import score
+
+logger = logging.getLogger(__name__)
+
+LANDMARK_DIR = os.environ.get("INTERVIEWLY_LANDMARK_DIR", os.path.join(".cache", "landmarks"))
+LANDMARK_MAX_BYTES = int(os.environ.get("INTERVIEWLY_LANDMARK_MAX_MB", "1024")) * 1024 * 1024
+LANDMARK_PARAMS = ("sampling", "preprocess")  # constructor arguments that change the landmarks themselves
+
+
+def landmark_key(video_hash, name, version, params):
+    """Store key: like the result cache key, but without the scoring thresholds."""
+    shaping = {key: value for key, value in params.items() if key in LANDMARK_PARAMS}
+    return cache_key(video_hash, f"{name}.landmarks", version, shaping)
+
+
+def merge_recordings(parts):
+    """Concatenates the recordings of consecutive time shards, in order."""
+    parts = [part for part in parts if part is not None and len(part["frames"])]
+    if not parts:
+        return None
+    return {
+        "frames": np.concatenate([part["frames"] for part in parts]),
+        "points": np.concatenate([part["points"] for part in parts]),
+        "end_frame": parts[-1]["end_frame"],
+    }
+
+
+# --- Array Store ---
+class LandmarkStore:
+    """Keeps recordings as ``<key>.frames.npy``, ``<key>.points.npy`` and ``<key>.json``.
+
+    Arrays are read back memory-mapped, so re-scoring a long video only
+    touches the columns the rules need. The JSON metadata is written last and
+    marks a complete entry; entries are evicted least recently used.
+    """
+
+    def __init__(self, root=LANDMARK_DIR, max_bytes=LANDMARK_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def _paths(self, key):
+        base = os.path.join(self.root, key)
+        return f"{base}.frames.npy", f"{base}.points.npy", f"{base}.json"
+
+    def get(self, key):
+        """Returns the recording with memory-mapped arrays, or None if it is not stored."""
+        frames_path, points_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            recording = {
+                "frames": np.load(frames_path, mmap_mode="r"),
+                "points": np.load(points_path, mmap_mode="r"),
+                "end_frame": meta["end_frame"],
+            }
+            os.utime(meta_path)
+            return recording
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable landmark entry {key}: {e}")
+            self.remove(key)
+            return None
+
+    def put(self, key, recording):
+        """Writes a recording atomically (metadata last) and evicts old entries."""
+        frames_path, points_path, meta_path = self._paths(key)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        for path, array in ((frames_path, recording["frames"]), (points_path, recording["points"])):
+            with open(path + suffix, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(path + suffix, path)
+        meta = {
+            "end_frame": int(recording["end_frame"]),
+            "shape": list(recording["points"].shape),
+            "dtype": str(recording["points"].dtype),
+        }
+        with open(meta_path + suffix, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(meta_path + suffix, meta_path)
+        self.evict()
+
+    def remove(self, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        """Deletes the least recently used entries until the store fits in max_bytes."""
+        with self.lock:
+            entries = []
+            for name in os.listdir(self.root):
+                if not name.endswith(".json"):
+                    continue
+                key = name[:-len(".json")]
+                try:
+                    size = sum(os.path.getsize(path) for path in self._paths(key))
+                    used = os.path.getmtime(self._paths(key)[2])
+                except FileNotFoundError:
+                    continue
+                entries.append((used, size, key))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, key in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                self.remove(key)
+                total -= size
+
+
+_default_store = None
+
+
+def get_landmark_store():
+    """Returns the process-wide landmark store."""
+    global _default_store
+    if _default_store is None:
+        _default_store = LandmarkStore()
+    return _default_store
+
+
+# --- Re-Scoring ---
+def rescore(name, recording, threshold=0.05):
+    """Scores a stored recording with the vectorized rules; returns the same result shape as the live analyzer.
+
+    Eye contact and posture return ``(score, hits, total, sampled)``, gestures
+    return ``(gesture_counts, sampled)``.
+    """
+    return score(name, recording["points"], recording["frames"], recording["end_frame"], threshold)
@@ -0,0 +1,335 @@
+"""Real-time eye contact, posture and gesture checks on a live frame source.
+
+A capture thread reads the source (a webcam, or a file replayed at wall-clock
+speed) into a single-frame slot; the analysis thread always takes the newest
+frame. Frames that arrive while the analyzers are busy overwrite the slot
+and are dropped instead of queued, and a frame that is already older than
+the latency budget when it is taken is dropped as well, so the delay between
+capture and score stays bounded however slow the CPU is. When analysing a
+frame itself overruns the budget, the analyzers take turns (one per frame)
+until latency recovers.
+
+Scores are rolling: the share of frames with eye contact / good posture and
+the gesture counts over the last ``window_seconds``, together with the
+achieved analysis fps, dropped frames and latency percentiles.
+"""
+import os
+import time
+import logging
+import threading
+from collections import deque
+
+import cv2
+
+from interviewly.analyzers import EyeContactAnalyzer, PostureAnalyzer, GestureAnalyzer
+from interviewly.preprocess import preprocess_settings
+from interviewly.metrics import quantile
+from interviewly.scoring import GESTURES
+
+logger = logging.getLogger(__name__)
+
+LIVE_ANALYZERS = {
+    "eyecontact": EyeContactAnalyzer,
+    "posture": PostureAnalyzer,
+    "gesture": GestureAnalyzer,
+}
+LIVE_BUDGET_MS = float(os.environ.get("INTERVIEWLY_LIVE_BUDGET_MS", "150"))
+LIVE_WINDOW_SECONDS = float(os.environ.get("INTERVIEWLY_LIVE_WINDOW_SECONDS", "10"))
+LIVE_PREPROCESS = os.environ.get("INTERVIEWLY_LIVE_PREPROCESS", "fast")
+RECOVER_RATIO = 0.8  # leave turn-taking once latency is this far under budget
+
+
+# --- Frame Sources ---
+class CameraSource:
+    """Frames from a local webcam (an OpenCV device index), as fast as the camera delivers them."""
+
+    def __init__(self, index=0, width=None, height=None):
+        self.index = index
+        self.width = width
+        self.height = height
+
+    def frames(self, stop):
+        """Yields ``(frame_bgr, captured_at)`` until ``stop`` is set or the camera fails."""
+        cap = cv2.VideoCapture(self.index)
+        if not cap.isOpened():
+            raise ValueError(f"Could not open camera {self.index}")
+        if self.width and self.height:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        try:
+            while not stop.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    logger.warning(f"Camera {self.index} stopped delivering frames")
+                    break
+                yield frame, time.monotonic()
+        finally:
+            cap.release()
+
+
+class ReplaySource:
+    """Frames from a video file released at wall-clock speed, like a camera.
+
+    Frames whose release time has already passed (slow decoding) are skipped
+    with ``grab()`` rather than delivered late. ``speed`` scales the clock.
+    """
+
+    def __init__(self, path, speed=1.0, loop=False):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+
+    def frames(self, stop):
+        while True:
+            played = 0
+            for item in self._play(stop):
+                played += 1
+                yield item
+            # An empty pass (undecodable file) would otherwise loop without ever sleeping
+            if not self.loop or stop.is_set() or not played:
+                return
+
+    def _play(self, stop):
+        cap = cv2.VideoCapture(self.path)
+        if not cap.isOpened():
+            raise ValueError(f"Could not open video file: {self.path}")
+        interval = 1.0 / ((cap.get(cv2.CAP_PROP_FPS) or 30) * self.speed)
+        started = time.monotonic()
+        frame_index = 0
+        try:
+            while not stop.is_set():
+                due = started + frame_index * interval
+                now = time.monotonic()
+                if now < due:
+                    time.sleep(due - now)
+                elif now - due > interval:
+                    # Behind schedule: skip this frame without decoding it
+                    if not cap.grab():
+                        break
+                    frame_index += 1
+                    continue
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                frame_index += 1
+                yield frame, time.monotonic()
+        finally:
+            cap.release()
+
+
+# --- Latest-Frame Slot ---
+class FrameSlot:
+    """Holds only the newest captured frame; an unread frame is overwritten and counted as dropped."""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.frame = None
+        self.captured_at = None
+        self.closed = False
+        self.captured = 0
+        self.dropped = 0
+
+    def put(self, frame, captured_at):
+        with self.condition:
+            if self.frame is not None:
+                self.dropped += 1
+            self.frame, self.captured_at = frame, captured_at
+            self.captured += 1
+            self.condition.notify()
+
+    def take(self, timeout=1.0):
+        """Returns ``(frame, captured_at)``; ``(None, None)`` on timeout or once the source has ended."""
+        with self.condition:
+            self.condition.wait_for(lambda: self.frame is not None or self.closed, timeout)
+            frame, captured_at = self.frame, self.captured_at
+            self.frame = self.captured_at = None
+            return frame, captured_at
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+# --- Live Session ---
+class LiveSession:
+    """Runs the live analyzers on a frame source in two background threads.
+
+    ``budget_ms`` bounds the delay from capture to score, ``window_seconds``
+    is the span of the rolling scores and ``preprocess`` the preprocessing
+    profile (see interviewly.preprocess; "fast" suits modest CPUs).
+    ``on_update`` is called from the analysis thread with a snapshot() at most
+    every ``update_interval`` seconds.
+    """
+
+    def __init__(self, source, names=tuple(LIVE_ANALYZERS), budget_ms=LIVE_BUDGET_MS,
+                 window_seconds=LIVE_WINDOW_SECONDS, preprocess=LIVE_PREPROCESS, threshold=0.05,
+                 on_update=None, update_interval=1.0):
+        unknown = [name for name in names if name not in LIVE_ANALYZERS]
+        if unknown:
+            raise ValueError(f"No live analyzer for: {', '.join(unknown)}")
+        self.source = source
+        self.names = tuple(names)
+        self.budget = budget_ms / 1000
+        self.window_seconds = window_seconds
+        self.preprocess = preprocess
+        self.threshold = threshold
+        self.on_update = on_update
+        self.update_interval = update_interval
+
+        self.slot = FrameSlot()
+        self.stop_event = threading.Event()
+        self.lock = threading.Lock()
+        self.labels = {name: deque() for name in self.names}  # (captured_at, label) per analyzer
+        self.processed = deque()  # (captured_at, latency) per analyzed frame
+        self.frames = 0
+        self.stale = 0
+        self.degraded = False
+        self.error = None
+        self.threads = []
+
+    def _build_analyzers(self, analyzers):
+        """Fills ``analyzers`` in place, so the caller can close the ones built before a failure."""
+        for name in self.names:
+            params = {"preprocess": preprocess_settings(self.preprocess, name)}
+            if name != "gesture":
+                params["threshold"] = self.threshold
+            analyzers[name] = LIVE_ANALYZERS[name](**params)
+
+    # --- Threads ---
+    def start(self):
+        self.threads = [
+            threading.Thread(target=self._capture, name="live-capture", daemon=True),
+            threading.Thread(target=self._analyze, name="live-analyze", daemon=True),
+        ]
+        for thread in self.threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        self.slot.close()
+
+    def join(self, timeout=None):
+        """Waits for both threads, at most ``timeout`` seconds in total."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self.threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def running(self):
+        return any(thread.is_alive() for thread in self.threads)
+
+    def _capture(self):
+        try:
+            for frame, captured_at in self.source.frames(self.stop_event):
+                self.slot.put(frame, captured_at)
+        except Exception as e:
+            logger.error(f"Live source failed: {e}")
+            self.error = str(e)
+        finally:
+            self.slot.close()
+
+    def _analyze(self):
+        analyzers = {}
+        try:
+            # Graphs are checked out on this thread, which is the only one to use them
+            self._build_analyzers(analyzers)
+            turn = 0
+            last_update = time.monotonic()
+            while not self.stop_event.is_set():
+                frame, captured_at = self.slot.take()
+                if frame is None:
+                    if self.slot.closed:
+                        break
+                    continue
+                if time.monotonic() - captured_at > self.budget:
+                    with self.lock:
+                        self.stale += 1
+                    continue
+
+                if self.degraded:
+                    names = (self.names[turn % len(self.names)],)
+                    turn += 1
+                else:
+                    names = self.names
+                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                labels = {name: analyzers[name].label_frame(frame_rgb) for name in names}
+                self._record(captured_at, labels, time.monotonic() - captured_at)
+
+                if self.on_update is not None and time.monotonic() - last_update >= self.update_interval:
+                    last_update = time.monotonic()
+                    self.on_update(self.snapshot())
+        except Exception as e:
+            logger.error(f"Live analysis failed: {e}")
+            self.error = str(e)
+        finally:
+            for analyzer in analyzers.values():
+                analyzer.close()
+            self.stop()
+
+    def _record(self, captured_at, labels, latency):
+        with self.lock:
+            self.frames += 1
+            for name, label in labels.items():
+                self.labels[name].append((captured_at, label))
+            self.processed.append((captured_at, latency))
+
+            if latency > self.budget:
+                self.degraded = True
+            elif latency < self.budget * RECOVER_RATIO:
+                self.degraded = False
+
+            horizon = captured_at - self.window_seconds
+            for window in (self.processed, *self.labels.values()):
+                while window and window[0][0] < horizon:
+                    window.popleft()
+
+    # --- Rolling Scores ---
+    def snapshot(self):
+        """Returns the rolling scores, achieved fps, dropped frames and latency as plain JSON-able values."""
+        with self.lock:
+            processed = list(self.processed)
+            labels = {name: [label for _, label in window] for name, window in self.labels.items()}
+            snapshot = {
+                "frames": self.frames,
+                "captured": self.slot.captured,
+                "dropped": self.slot.dropped + self.stale,
+                "stale": self.stale,
+                "degraded": self.degraded,
+                "error": self.error,
+            }
+
+        span = processed[-1][0] - processed[0][0] if len(processed) > 1 else 0
+        snapshot["fps"] = (len(processed) - 1) / span if span > 0 else 0.0
+        latencies = sorted(latency * 1000 for _, latency in processed)
+        snapshot["latency_ms"] = {
+            "p50": quantile(latencies, 0.5) if latencies else None,
+            "p90": quantile(latencies, 0.9) if latencies else None,
+            "max": latencies[-1] if latencies else None,
+            "budget": self.budget * 1000,
+        }
+
+        scores = {}
+        for name, values in labels.items():
+            if name == "gesture":
+                counts = {gesture: 0 for gesture in GESTURES}
+                for label in values:
+                    counts[GESTURES[int(label)]] += 1
+                scores[name] = counts
+            else:
+                scores[name] = (sum(bool(label) for label in values) / len(values)) * 100 if values else None
+        snapshot["scores"] = scores
+        return snapshot
+
+
+def run_live(source, duration=None, **options):
+    """Runs a LiveSession in the foreground for ``duration`` seconds (or until the source ends); returns the last snapshot."""
+    session = LiveSession(source, **options).start()
+    try:
+        session.join(duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        session.stop()
+        session.join()
+    return session.snapshot()
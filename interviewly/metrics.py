@@ -0,0 +1,125 @@
+"""Lightweight stage timing for the analysis hot paths.
+
+A ``StageMetrics`` collects wall-clock samples per named stage (decode,
+convert, model inference, postprocess, audio extraction, transcription, ...)
+and summarizes them as totals, percentiles and throughput. Summaries are
+attached to job results for the UI and exported in the Prometheus text
+format, one file per pipeline under ``METRICS_DIR``, so a node_exporter
+textfile collector can scrape them.
+"""
+import os
+import time
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+METRICS_DIR = os.environ.get("INTERVIEWLY_METRICS_DIR", os.path.join(".cache", "metrics"))
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class StageMetrics:
+    """Per-stage duration samples for one analysis run.
+
+    Recording a sample is a dict lookup and a list append, cheap enough for
+    per-frame use. Samples from worker processes are combined with merge().
+    """
+
+    def __init__(self):
+        self.samples = {}
+        self.gauges = {}
+
+    def observe(self, stage, seconds):
+        self.samples.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def timer(self, stage):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def set(self, name, value):
+        """Records a run-level value such as the media duration."""
+        self.gauges[name] = value
+
+    def merge(self, samples):
+        """Adds samples exported by another process (``StageMetrics.samples``)."""
+        for stage, values in samples.items():
+            self.samples.setdefault(stage, []).extend(values)
+
+    def summary(self):
+        """Returns ``{"stages": {stage: stats}, **gauges}`` as plain JSON-able values.
+
+        ``rate`` is how many calls of the stage fit in one second of its own
+        time; for ``frame`` that is the pipeline's frames per second.
+        """
+        stages = {}
+        for stage, values in self.samples.items():
+            values = sorted(values)
+            total = sum(values)
+            stats = {"count": len(values), "total": total, "max": values[-1]}
+            for q in QUANTILES:
+                stats[f"p{q * 100:g}"] = quantile(values, q)
+            stats["rate"] = len(values) / total if total > 0 else None
+            stages[stage] = stats
+        return {"stages": stages, **self.gauges}
+
+    def export(self, pipeline, metrics_dir=METRICS_DIR):
+        """Writes the summary to ``<metrics_dir>/<pipeline>.prom``; never raises."""
+        try:
+            write_prometheus(os.path.join(metrics_dir, f"{pipeline}.prom"), pipeline, self.summary())
+        except OSError as e:
+            logger.warning(f"Could not write metrics for {pipeline}: {e}")
+
+
+def quantile(values, q):
+    """Linearly interpolated quantile of an already sorted, non-empty list."""
+    position = (len(values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+# --- Prometheus Text Export ---
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def write_prometheus(path, pipeline, summary):
+    """Atomically writes a summary as Prometheus text-format metrics for the last run."""
+    lines = [
+        "# HELP interviewly_stage_seconds Duration of one call of an analysis stage in the last run.",
+        "# TYPE interviewly_stage_seconds summary",
+    ]
+    for stage, stats in sorted(summary["stages"].items()):
+        labels = f'pipeline="{_label(pipeline)}",stage="{_label(stage)}"'
+        for q in QUANTILES:
+            lines.append(f'interviewly_stage_seconds{{{labels},quantile="{q:g}"}} {stats[f"p{q * 100:g}"]}')
+        lines.append(f"interviewly_stage_seconds_sum{{{labels}}} {stats['total']}")
+        lines.append(f"interviewly_stage_seconds_count{{{labels}}} {stats['count']}")
+
+    lines += [
+        "# HELP interviewly_stage_rate Calls per second of stage time in the last run.",
+        "# TYPE interviewly_stage_rate gauge",
+    ]
+    for stage, stats in sorted(summary["stages"].items()):
+        if stats["rate"] is not None:
+            lines.append(f'interviewly_stage_rate{{pipeline="{_label(pipeline)}",stage="{_label(stage)}"}} {stats["rate"]}')
+
+    lines += [
+        "# HELP interviewly_run_info Run-level values of the last run (media duration, frames, ...).",
+        "# TYPE interviewly_run_info gauge",
+    ]
+    for name, value in sorted(summary.items()):
+        if name != "stages" and isinstance(value, (int, float)):
+            lines.append(f'interviewly_run_info{{pipeline="{_label(pipeline)}",name="{_label(name)}"}} {value}')
+    lines.append("# TYPE interviewly_last_run_timestamp_seconds gauge")
+    lines.append(f'interviewly_last_run_timestamp_seconds{{pipeline="{_label(pipeline)}"}} {time.time()}')
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
@@ -0,0 +1,314 @@
+import os
+import time
+import inspect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+
+from interviewly.analyzers import EyeContactAnalyzer, PostureAnalyzer, GestureAnalyzer
+from interviewly.emotion import EmotionAnalyzer
+from interviewly.cache import hash_file, cache_key, get_cache
+from interviewly.preprocess import preprocess_settings
+from interviewly.metrics import StageMetrics
+from interviewly.landmarks import get_landmark_store, landmark_key, merge_recordings, rescore
+
+SHARD_WORKERS = int(os.environ.get("INTERVIEWLY_SHARD_WORKERS", os.cpu_count() or 1))
+# Recording every analysis costs ~150 MB of FaceMesh landmarks per 30 minutes; rescore_video() records on demand
+RECORD_LANDMARKS = os.environ.get("INTERVIEWLY_RECORD_LANDMARKS", "0") == "1"
+MIN_SHARD_FRAMES = 900  # ~30s at 30fps; shorter videos are not worth a process start
+SHARD_OVERLAP_FRAMES = 30  # warm-up frames so MediaPipe tracking is settled at each boundary
+
+ANALYZERS = {
+    "eyecontact": EyeContactAnalyzer,
+    "posture": PostureAnalyzer,
+    "gesture": GestureAnalyzer,
+    "emotion": EmotionAnalyzer,
+}
+
+
+# --- Single-Decode Frame Pipeline ---
+def run_pipeline(video_path, analyzers, start_frame=0, end_frame=None, warmup_frames=0, progress=None,
+                 metrics=None, recordings=None):
+    """Decodes each frame once, converts it to RGB once and feeds every analyzer.
+
+    ``start_frame``/``end_frame`` restrict the run to a time range; the
+    ``warmup_frames`` before ``start_frame`` are decoded only to prime tracking
+    state and are not counted. ``progress`` is called with the completed
+    fraction after every frame. With a StageMetrics, every counted frame is
+    timed per stage: ``decode``, ``convert``, each analyzer's ``<name>`` call
+    (plus its own ``.inference``/``.postprocess``), ``frame`` overall and
+    ``results`` for the final aggregation. Landmark recordings of analyzers
+    built with ``record_landmarks`` are put into the ``recordings`` dict.
+    """
+    cap = None
+    clock = time.perf_counter
+    # Everything after the analyzers were built is inside the try, so their graphs always go back to the pool
+    try:
+        cap = cv2.VideoCapture(video_path)
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30
+        last_frame = end_frame or int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        for analyzer in analyzers:
+            analyzer.metrics = metrics
+            analyzer.start(fps)
+
+        frame_index = max(0, start_frame - warmup_frames)
+        if frame_index > 0:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+
+        while cap.isOpened() and (end_frame is None or frame_index < end_frame):
+            frame_started = clock()
+            ret, frame = cap.read()
+            if not ret:
+                break
+            decoded = clock()
+
+            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if frame_index < start_frame:
+                for analyzer in analyzers:
+                    analyzer.warmup(frame_index, frame, frame_rgb)
+            elif metrics is None:
+                for analyzer in analyzers:
+                    analyzer.process(frame_index, frame, frame_rgb)
+            else:
+                converted = clock()
+                metrics.observe("decode", decoded - frame_started)
+                metrics.observe("convert", converted - decoded)
+                for analyzer in analyzers:
+                    started = clock()
+                    analyzer.process(frame_index, frame, frame_rgb)
+                    metrics.observe(analyzer.name, clock() - started)
+                metrics.observe("frame", clock() - frame_started)
+            frame_index += 1
+            if progress and last_frame > start_frame:
+                progress(min(1.0, (frame_index - start_frame) / (last_frame - start_frame)))
+
+        if recordings is not None:
+            for analyzer in analyzers:
+                if getattr(analyzer, "record_landmarks", False):
+                    recordings[analyzer.name] = analyzer.recording()
+        if metrics is None:
+            return {analyzer.name: analyzer.result() for analyzer in analyzers}
+        with metrics.timer("results"):
+            return {analyzer.name: analyzer.result() for analyzer in analyzers}
+    finally:
+        if cap is not None:
+            cap.release()
+        for analyzer in analyzers:
+            analyzer.close()
+
+
+def build_analyzers(names, params=None):
+    """Builds the named analyzers; if one constructor fails, the ones already built are closed."""
+    params = params or {}
+    analyzers = []
+    try:
+        for name in names:
+            analyzers.append(ANALYZERS[name](**params.get(name, {})))
+    except BaseException:
+        for analyzer in analyzers:
+            analyzer.close()
+        raise
+    return analyzers
+
+
+# --- Time-Sharded Multi-Process Execution ---
+def plan_shards(frame_count, workers, min_shard_frames=MIN_SHARD_FRAMES):
+    """Splits ``[0, frame_count)`` into contiguous ``(start, end)`` ranges, one per worker.
+
+    The last range is open-ended (``end=None``) because container frame
+    counts are estimates.
+    """
+    shards = max(1, min(workers, frame_count // min_shard_frames))
+    bounds = [frame_count * i // shards for i in range(shards)] + [None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _run_shard(video_path, names, params, start_frame, end_frame, warmup_frames, instrument=False):
+    """Process-pool entry point: builds fresh analyzers and runs one time range.
+
+    Returns the results, the shard's timing samples when ``instrument`` is set,
+    and its landmark recordings.
+    """
+    analyzers = build_analyzers(names, params)
+    metrics = StageMetrics() if instrument else None
+    recordings = {}
+    results = run_pipeline(video_path, analyzers, start_frame, end_frame, warmup_frames, metrics=metrics,
+                           recordings=recordings)
+    return results, metrics.samples if metrics else None, recordings
+
+
+def run_sharded(video_path, names, params=None, workers=None, overlap_frames=SHARD_OVERLAP_FRAMES, progress=None,
+                metrics=None, recordings=None):
+    """Runs the analyzers over time shards in parallel processes and merges the results in order.
+
+    Each worker seeks to its own range and holds its own MediaPipe graphs;
+    shards after the first decode ``overlap_frames`` extra frames to warm up
+    tracking before counting starts. Shard timings are merged into ``metrics``
+    and landmark recordings into ``recordings``.
+    """
+    params = params or {}
+    workers = workers or SHARD_WORKERS
+
+    cap = cv2.VideoCapture(video_path)
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+
+    shards = plan_shards(frame_count, workers)
+    if len(shards) == 1:
+        analyzers = build_analyzers(names, params)
+        return run_pipeline(video_path, analyzers, progress=progress, metrics=metrics, recordings=recordings)
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as executor:
+        futures = [
+            executor.submit(_run_shard, video_path, names, params, start, end, overlap_frames if start else 0,
+                            metrics is not None)
+            for start, end in shards
+        ]
+        for done, _ in enumerate(as_completed(futures), 1):
+            if progress:
+                progress(done / len(futures))
+        parts = []
+        shard_recordings = []
+        for future in futures:
+            results, samples, recorded = future.result()
+            parts.append(results)
+            shard_recordings.append(recorded)
+            if metrics is not None:
+                metrics.merge(samples)
+
+    if metrics is not None:
+        metrics.set("shards", len(shards))
+    if recordings is not None:
+        for name in shard_recordings[0]:
+            recordings[name] = merge_recordings([recorded[name] for recorded in shard_recordings])
+    return {name: ANALYZERS[name].merge([part[name] for part in parts]) for name in names}
+
+
+def analyzer_params(name, overrides=None):
+    """Returns the result-affecting constructor arguments of an analyzer, defaults filled in."""
+    cls = ANALYZERS[name]
+    signature = inspect.signature(cls.__init__)
+    params = {key: signature.parameters[key].default for key in cls.result_params}
+    params.update(overrides or {})
+    return params
+
+
+def analyze_video(video_path, names=None, params=None, use_cache=True, workers=None, progress=None, metrics=None,
+                  record_landmarks=RECORD_LANDMARKS):
+    """Runs the named analyzers (default: all) over the video in a single pass.
+
+    ``params`` maps analyzer names to constructor overrides. Results are looked
+    up in the on-disk result cache first and only the missing analyzers run,
+    split across up to ``workers`` processes for long videos. Stage timings of
+    the run are recorded into ``metrics`` (a StageMetrics) when given. With
+    the cache on and ``record_landmarks`` (default: INTERVIEWLY_RECORD_LANDMARKS=1),
+    analyzers that support it also record their landmarks into the landmark
+    store, so a later rescore_video() needs no inference.
+    """
+    names = names or list(ANALYZERS)
+    params = params or {}
+    results = {}
+    keys = {}
+    record_landmarks = use_cache and record_landmarks
+    recordings = {} if record_landmarks else None
+
+    if use_cache:
+        cache = get_cache()
+        video_hash = hash_file(video_path)
+        for name in names:
+            keys[name] = cache_key(video_hash, name, ANALYZERS[name].version, analyzer_params(name, params.get(name)))
+            cached = cache.get(keys[name])
+            if cached is not None:
+                results[name] = cached
+        if metrics is not None:
+            metrics.set("cached_analyzers", len(results))
+
+    missing = [name for name in names if name not in results]
+    if missing:
+        run_params = dict(params)
+        if record_landmarks:
+            for name in missing:
+                if ANALYZERS[name].landmark_count:
+                    run_params[name] = {**params.get(name, {}), "record_landmarks": True}
+        fresh = run_sharded(video_path, missing, run_params, workers, progress=progress, metrics=metrics,
+                            recordings=recordings)
+        results.update(fresh)
+        if use_cache:
+            for name in missing:
+                cache.put(keys[name], fresh[name])
+        if record_landmarks:
+            store_recordings(video_hash, recordings, params)
+
+    return results
+
+
+# --- Landmark Re-Scoring ---
+def store_recordings(video_hash, recordings, params):
+    store = get_landmark_store()
+    for name, recording in recordings.items():
+        if recording is not None:
+            key = landmark_key(video_hash, name, ANALYZERS[name].version, analyzer_params(name, params.get(name)))
+            store.put(key, recording)
+
+
+def rescore_video(video_path, name, params=None, threshold=0.05):
+    """Scores eye contact, posture or gestures from stored landmarks with a new ``threshold``.
+
+    ``params`` are the analyzer overrides the landmarks were recorded with
+    (sampling, preprocess). Inference only runs if nothing is stored yet.
+    """
+    params = params or {}
+    video_hash = hash_file(video_path)
+    key = landmark_key(video_hash, name, ANALYZERS[name].version, analyzer_params(name, params))
+    store = get_landmark_store()
+    recording = store.get(key)
+    if recording is None:
+        recordings = {}
+        run_sharded(video_path, [name], {name: {**params, "record_landmarks": True}}, recordings=recordings)
+        if recordings.get(name) is None:
+            raise ValueError(f"No frames could be read from {video_path}")
+        store.put(key, recordings[name])
+        recording = recordings[name]
+    return rescore(name, recording, threshold)
+
+
+# --- Accuracy Check for Preprocessing ---
+def result_scores(name, result):
+    """Flattens an analyzer result into comparable percentages."""
+    if name == "gesture":
+        counts = result[0]
+        total = sum(counts.values()) or 1
+        return {gesture: count / total * 100 for gesture, count in counts.items()}
+    return {name: result[0]}
+
+
+def compare_to_full_resolution(video_path, preprocess_profile, names=("eyecontact", "posture", "gesture"),
+                               use_cache=True):
+    """Runs the analyzers with and without a preprocessing profile and reports score changes.
+
+    Returns ``{analyzer: {"full": scores, "preprocessed": scores, "max_delta": points,
+    "pixel_ratio": share}}`` where scores are percentages, ``max_delta`` is the
+    largest change in percentage points and ``pixel_ratio`` the fraction of
+    source pixels the preprocessed models actually saw. The preprocessed pass
+    always runs (in-process, uncached) so its preprocessors can be inspected.
+    """
+    names = list(names)
+    full = analyze_video(video_path, names, use_cache=use_cache)
+    params = {name: {"preprocess": preprocess_settings(preprocess_profile, name)} for name in names}
+    analyzers = build_analyzers(names, params)
+    reduced = run_pipeline(video_path, analyzers)
+
+    report = {}
+    for analyzer in analyzers:
+        name = analyzer.name
+        full_scores = result_scores(name, full[name])
+        reduced_scores = result_scores(name, reduced[name])
+        report[name] = {
+            "full": full_scores,
+            "preprocessed": reduced_scores,
+            "max_delta": max(abs(full_scores[key] - reduced_scores[key]) for key in full_scores),
+            "pixel_ratio": analyzer.preprocessor.pixel_ratio() if analyzer.preprocessor else 1.0,
+        }
+    return report
@@ -0,0 +1,98 @@
+import cv2
+import numpy as np
+
+# Accuracy-versus-speed knob: "full" is the original full-resolution behavior
+PREPROCESS_PROFILES = {
+    "full": None,
+    "balanced": {"max_side": 960, "roi": False},
+    "fast": {"max_side": 480, "roi": True},
+}
+
+# Largest input side each MediaPipe model benefits from (its internal crops are 192-256 px)
+MODEL_MAX_SIDE = {
+    "eyecontact": 640,
+    "posture": 512,
+    "gesture": 640,
+}
+
+
+# --- Resolution-Aware Preprocessing ---
+class FramePreprocessor:
+    """Downscales frames for a model and crops them to the last known region of interest.
+
+    The ROI is the bounding box of the previous frame's landmarks, grown by
+    ``roi_margin`` on each side; it falls back to the full frame whenever the
+    model loses the subject. Landmarks found in the crop are mapped back to
+    full-frame normalized coordinates so the scoring thresholds are unchanged.
+    """
+
+    def __init__(self, max_side=640, roi=True, roi_margin=0.25, min_roi_side=96):
+        self.max_side = max_side
+        self.roi = roi
+        self.roi_margin = roi_margin
+        self.min_roi_side = min_roi_side
+        self.box = None  # normalized (x0, y0, x1, y1) of the last subject
+        self.input_pixels = 0
+        self.source_pixels = 0
+
+    def prepare(self, frame_rgb):
+        """Returns ``(image, transform)``; transform is the crop ``(x0, y0, w, h, width, height)`` in pixels."""
+        height, width = frame_rgb.shape[:2]
+        x0, y0, w, h = 0, 0, width, height
+        if self.roi and self.box is not None:
+            bx0, by0, bx1, by1 = self.box
+            x0, y0 = int(bx0 * width), int(by0 * height)
+            w = max(self.min_roi_side, int(bx1 * width) - x0)
+            h = max(self.min_roi_side, int(by1 * height) - y0)
+            w, h = min(w, width - x0), min(h, height - y0)
+
+        image = frame_rgb[y0:y0 + h, x0:x0 + w]
+        scale = self.max_side / max(w, h)
+        if scale < 1:
+            image = cv2.resize(image, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=cv2.INTER_AREA)
+
+        self.source_pixels += width * height
+        self.input_pixels += image.shape[0] * image.shape[1]
+        return image, (x0, y0, w, h, width, height)
+
+    def to_frame(self, points, transform, track=True):
+        """Maps crop-normalized ``(n, 3)`` landmarks to full-frame normalized ones and, by default, updates the ROI."""
+        x0, y0, w, h, width, height = transform
+        if (x0, y0, w, h) != (0, 0, width, height):
+            scale = np.array([w / width, h / height, w / width], dtype=points.dtype)
+            offset = np.array([x0 / width, y0 / height, 0], dtype=points.dtype)
+            points = points * scale + offset
+        if track:
+            self.track(points)
+        return points
+
+    def track(self, points):
+        """Sets the ROI for the next frame from full-frame normalized ``(n, 3)`` points."""
+        x_min, y_min = points[:, :2].min(axis=0)
+        x_max, y_max = points[:, :2].max(axis=0)
+        margin_x = (x_max - x_min) * self.roi_margin
+        margin_y = (y_max - y_min) * self.roi_margin
+        self.box = (
+            max(0.0, x_min - margin_x), max(0.0, y_min - margin_y),
+            min(1.0, x_max + margin_x), min(1.0, y_max + margin_y),
+        )
+
+    def reset(self):
+        """Drops the ROI so the next frame is searched in full."""
+        self.box = None
+
+    def pixel_ratio(self):
+        """Fraction of source pixels actually sent to the model so far."""
+        return self.input_pixels / self.source_pixels if self.source_pixels else 1.0
+
+
+def preprocess_settings(profile, analyzer):
+    """Returns FramePreprocessor kwargs for a named profile and analyzer, or None for full resolution."""
+    if profile not in PREPROCESS_PROFILES:
+        raise ValueError(f"Unknown preprocessing profile: {profile!r} (expected one of {', '.join(PREPROCESS_PROFILES)})")
+    settings = PREPROCESS_PROFILES[profile]
+    if settings is None:
+        return None
+    settings = dict(settings)
+    settings["max_side"] = min(settings["max_side"], MODEL_MAX_SIDE.get(analyzer, settings["max_side"]))
+    return settings
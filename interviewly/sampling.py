@@ -0,0 +1,74 @@
+import os
+
+import cv2
+import numpy as np
+
+SAMPLING_MODES = ("all", "rate", "stride", "motion")
+MOTION_THUMBNAIL_SIZE = (64, 36)
+
+
+# --- Frame Sampling Policy ---
+class SamplingPolicy:
+    """Decides which frames run inference; skipped frames reuse the last label.
+
+    Modes:
+    - ``all``: every frame (the original behavior)
+    - ``rate``: about ``rate`` frames per second of video
+    - ``stride``: every ``stride``-th frame
+    - ``motion``: when the mean absolute difference of a small grayscale
+      thumbnail against the last inferred frame exceeds ``motion_threshold``
+      (0-255 scale), and at least every ``max_skip`` frames
+    """
+
+    def __init__(self, mode="all", rate=5, stride=5, motion_threshold=6.0, max_skip=30):
+        if mode not in SAMPLING_MODES:
+            raise ValueError(f"Unknown sampling mode: {mode!r} (expected one of {', '.join(SAMPLING_MODES)})")
+        self.mode = mode
+        self.rate = rate
+        self.stride = stride
+        self.motion_threshold = motion_threshold
+        self.max_skip = max_skip
+        self.interval = 1
+        self.last_thumbnail = None
+        self.frames_since_sample = 0
+
+    def start(self, fps):
+        """Resolves the sampling interval for the source frame rate."""
+        if self.mode == "rate":
+            self.interval = max(1, int(round(fps / self.rate)))
+        elif self.mode == "stride":
+            self.interval = max(1, self.stride)
+
+    def should_sample(self, frame_index, frame):
+        """Returns True when inference should run on this BGR frame."""
+        if self.mode == "all":
+            return True
+        if self.mode in ("rate", "stride"):
+            return frame_index % self.interval == 0
+
+        thumbnail = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), MOTION_THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA)
+        self.frames_since_sample += 1
+        if (
+            self.last_thumbnail is None
+            or self.frames_since_sample >= self.max_skip
+            or np.mean(cv2.absdiff(thumbnail, self.last_thumbnail)) > self.motion_threshold
+        ):
+            self.last_thumbnail = thumbnail
+            self.frames_since_sample = 0
+            return True
+        return False
+
+
+def default_sampling():
+    """Returns the host-wide sampling settings from the environment, or None for every frame."""
+    mode = os.environ.get("INTERVIEWLY_SAMPLING_MODE", "all")
+    if mode not in SAMPLING_MODES:
+        raise ValueError(f"Unknown INTERVIEWLY_SAMPLING_MODE: {mode!r} (expected one of {', '.join(SAMPLING_MODES)})")
+    if mode == "all":
+        return None
+    settings = {"mode": mode}
+    for key, cast in (("rate", float), ("stride", int), ("motion_threshold", float), ("max_skip", int)):
+        value = os.environ.get(f"INTERVIEWLY_SAMPLING_{key.upper()}")
+        if value is not None:
+            settings[key] = cast(value)
+    return settings
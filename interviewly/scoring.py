@@ -0,0 +1,121 @@
+"""Vectorized eye contact, posture and gesture rules over landmark arrays.
+
+Every rule takes a ``(frames, landmarks, 3)`` float array of full-frame
+normalized coordinates, NaN where nothing was detected, and returns one label
+per frame. Only NumPy is needed, so the rules can be exercised on synthetic
+arrays without MediaPipe or a video.
+"""
+import numpy as np
+
+# --- Landmark Indices ---
+LEFT_EYE = [33, 133]  # Left eye inner & outer corners
+RIGHT_EYE = [362, 263]  # Right eye inner & outer corners
+NOSE = 1  # Nose tip (used for center reference)
+FACE_POINTS = 468
+
+LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP = 11, 12, 23, 24  # MediaPipe Pose
+POSE_POINTS = 33
+
+WRIST, THUMB_TIP, INDEX_FINGER_TIP, PINKY_TIP = 0, 4, 8, 20  # MediaPipe Hands
+HAND_POINTS = 21
+MAX_HANDS = 2
+
+GESTURES = ["Open Palm", "Fist", "Thumbs Up", "Victory", "No Hand"]
+NO_HAND = GESTURES.index("No Hand")
+
+
+def as_points(landmarks, dtype=np.float32):
+    """Converts MediaPipe landmarks (anything with .x/.y/.z) to an ``(n, 3)`` array."""
+    return np.array([(p.x, p.y, p.z) for p in landmarks], dtype=dtype)
+
+
+# --- Per-Frame Rules ---
+def eye_contact_labels(points, threshold=0.05):
+    """True where both eye midpoints are within ``threshold`` of the nose horizontally."""
+    x = np.asarray(points[:, :, 0], dtype=np.float32)
+    left_eye_x = (x[:, LEFT_EYE[0]] + x[:, LEFT_EYE[1]]) / 2
+    right_eye_x = (x[:, RIGHT_EYE[0]] + x[:, RIGHT_EYE[1]]) / 2
+    nose_x = x[:, NOSE]
+    # NaN rows (no face) compare False: no eye contact
+    return (np.abs(left_eye_x - nose_x) < threshold) & (np.abs(right_eye_x - nose_x) < threshold)
+
+
+def posture_labels(points, threshold=0.05):
+    """True where both the shoulders and the hips are level within ``threshold``."""
+    y = np.asarray(points[:, :, 1], dtype=np.float32)
+    shoulder_slope = np.abs(y[:, LEFT_SHOULDER] - y[:, RIGHT_SHOULDER])
+    hip_slope = np.abs(y[:, LEFT_HIP] - y[:, RIGHT_HIP])
+    return (shoulder_slope < threshold) & (hip_slope < threshold)
+
+
+def hand_gestures(points):
+    """Returns ``(frames, hands)`` indices into GESTURES, one per hand slot.
+
+    ``points`` holds the hands one after another (21 landmarks each); empty
+    slots are NaN and come out as "No Hand". The rule order matches the
+    original per-frame checks, including the unreachable "Fist" branch.
+    """
+    y = np.asarray(points[:, :, 1], dtype=np.float32).reshape(len(points), -1, HAND_POINTS)
+    thumb_tip = y[..., THUMB_TIP]
+    index_tip = y[..., INDEX_FINGER_TIP]
+    pinky_tip = y[..., PINKY_TIP]
+    wrist = y[..., WRIST]
+
+    conditions = [
+        (thumb_tip < wrist) & (index_tip < wrist),
+        (index_tip < wrist) & (pinky_tip < wrist),
+        (thumb_tip > wrist) & (index_tip > wrist) & (pinky_tip > wrist),
+    ]
+    choices = [GESTURES.index("Thumbs Up"), GESTURES.index("Victory"), GESTURES.index("Open Palm")]
+    return np.select(conditions, choices, default=NO_HAND)
+
+
+def gesture_labels(points):
+    """One gesture per frame: the first hand's, or the next hand's where the first shows none."""
+    per_hand = hand_gestures(points)
+    labels = per_hand[:, 0]
+    for hand in range(1, per_hand.shape[1]):
+        labels = np.where(labels == NO_HAND, per_hand[:, hand], labels)
+    return labels
+
+
+RULES = {
+    "eyecontact": eye_contact_labels,
+    "posture": posture_labels,
+    "gesture": gesture_labels,
+}
+
+
+# --- Aggregation ---
+def frame_weights(frames, end_frame):
+    """How many frames share each inferred frame's label (up to the next inferred frame or ``end_frame``)."""
+    frames = np.asarray(frames, dtype=np.int64)
+    return np.diff(np.append(frames, end_frame))
+
+
+def ratio_score(labels, weights):
+    """Returns ``(score, hits, total, sampled)`` for the share of frames labelled True."""
+    total = int(weights.sum())
+    hits = int(weights[labels].sum())
+    score = (hits / total) * 100 if total > 0 else 0
+    return score, hits, total, len(weights)
+
+
+def gesture_score(labels, weights):
+    """Returns ``(gesture_counts, sampled)`` with every frame counted once."""
+    counts = np.bincount(labels, weights=weights, minlength=len(GESTURES))
+    return {gesture: int(count) for gesture, count in zip(GESTURES, counts)}, len(weights)
+
+
+def aggregate(name, labels, weights):
+    if name == "gesture":
+        return gesture_score(labels, weights)
+    return ratio_score(labels, weights)
+
+
+def score(name, points, frames, end_frame, threshold=0.05):
+    """Labels every inferred frame and aggregates in one call; the result matches the analyzer's."""
+    if name not in RULES:
+        raise ValueError(f"No landmark rules for analyzer: {name}")
+    labels = RULES[name](points) if name == "gesture" else RULES[name](points, threshold)
+    return aggregate(name, labels, frame_weights(frames, end_frame))
@@ -0,0 +1,136 @@
+import os
+import time
+import logging
+
+from textblob import TextBlob
+
+from interviewly import speech
+from interviewly.fillers import FillerScanner, FillerStream, tokenize
+
+logger = logging.getLogger(__name__)
+
+FILLER_LANGUAGE = os.environ.get("INTERVIEWLY_FILLER_LANGUAGE", "en")
+
+_filler_scanner = None
+
+
+def get_filler_scanner():
+    """Returns the process-wide filler scanner for the configured language."""
+    global _filler_scanner
+    if _filler_scanner is None:
+        _filler_scanner = FillerScanner.for_language(FILLER_LANGUAGE)
+    return _filler_scanner
+
+
+# --- Enhanced Sentiment Analysis ---
+def analyze_sentiment(text, words=None, duration_seconds=None):
+    """Analyzes sentiment with improved validation; ``words`` are Whisper (word, start, end) timestamps
+
+    ``duration_seconds`` is the length of the recording, which filler rates are
+    taken over (default: the span from the first to the last word).
+    """
+    if not text.strip():
+        return {
+            "Sentiment": "No Speech",
+            "Sentiment Score": 0,
+            "Hesitation Count": 0,
+            "Grammar Issues": []
+        }
+
+    try:
+        blob = TextBlob(text)
+        sentiment_score = blob.sentiment.polarity
+
+        scanner = get_filler_scanner()
+        if words:
+            fillers = scanner.report(words, duration_seconds=duration_seconds)
+        else:
+            fillers = scanner.report(
+                ((token, index, index) for index, token in enumerate(tokenize(text))),
+                duration_seconds=0
+            )
+        hesitation_count = fillers["total"]
+
+        grammar_issues = [
+            str(sentence) for sentence in blob.sentences
+            if sentence.sentiment.polarity < -0.3
+            and len(sentence.words) > 3
+        ]
+
+        return {
+            "Sentiment": "Positive" if sentiment_score > 0.1 else 
+                        "Negative" if sentiment_score < -0.1 else "Neutral",
+            "Sentiment Score": sentiment_score,
+            "Hesitation Count": hesitation_count,
+            "Filler Counts": fillers["counts"],
+            "Filler Positions": fillers["positions"],
+            "Fillers Per Minute": fillers["per_minute"],
+            "Grammar Issues": grammar_issues
+        }
+    except Exception as e:
+        logger.error(f"Sentiment analysis failed: {str(e)}")
+        return {
+            "Sentiment": "Error",
+            "Sentiment Score": 0,
+            "Hesitation Count": 0,
+            "Grammar Issues": []
+        }
+
+
+# --- Full Speech Analysis ---
+def analyze_speech(video_path, profile=None, on_segment=None, metrics=None, cpus=None):
+    """Extracts audio, transcribes it and scores sentiment and fillers.
+
+    ``on_segment`` is called after every decoded segment with the running
+    state ``{"transcript", "fillers", "seconds", "duration"}`` so callers
+    can render partial results. Returns ``{"transcript", "words", "analysis"}``.
+    With a StageMetrics, ``audio_extract``, ``transcribe`` (per segment),
+    ``fillers`` and ``sentiment`` are timed. ``cpus`` bounds the cores
+    used to transcribe long audio (default all of them).
+    """
+    clock = time.perf_counter
+    started = clock()
+    audio = speech.extract_audio(video_path)
+    duration = len(audio) / speech.SAMPLE_RATE
+    scanner = get_filler_scanner()
+    if metrics is not None:
+        metrics.observe("audio_extract", clock() - started)
+        metrics.set("audio_seconds", duration)
+
+    texts = []
+    words = []
+    fillers = FillerStream(scanner)
+    filler_count = 0
+    started = clock()
+    for segment in speech.iter_transcribe(audio, profile, cpus=cpus):
+        decoded = clock()
+        texts.append(segment.text)
+        words.extend(segment.words)
+        filler_count = fillers.add(segment.words)
+        if metrics is not None:
+            metrics.observe("transcribe", decoded - started)
+            metrics.observe("fillers", clock() - decoded)
+        if on_segment:
+            on_segment({
+                "transcript": " ".join(texts),
+                "fillers": filler_count,
+                "seconds": segment.end,
+                "duration": duration,
+            })
+        started = clock()
+
+    transcript = " ".join(texts)
+    started = clock()
+    analysis = analyze_sentiment(transcript, words, duration_seconds=duration)
+    if metrics is not None:
+        metrics.observe("sentiment", clock() - started)
+    return {
+        "transcript": transcript,
+        "words": words,
+        "analysis": analysis,
+    }
+
+
+def running_polarity(text):
+    """TextBlob polarity of a partial transcript, for live display."""
+    return TextBlob(text).sentiment.polarity if text.strip() else 0.0
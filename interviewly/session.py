@@ -0,0 +1,169 @@
+import os
+import time
+import threading
+
+import streamlit as st
+
+from interviewly.jobs import JobQueue, ensure_workers
+
+PREPROCESS_PROFILE = os.environ.get("INTERVIEWLY_PREPROCESS", "full")
+SAMPLED_ANALYZERS = ("eyecontact", "posture", "gesture")
+POLL_SECONDS = 1.0
+WORKER_CHECK_SECONDS = 15  # how often a waiting page restarts dead workers
+JOB_WAIT_SECONDS = float(os.environ.get("INTERVIEWLY_JOB_WAIT_MINUTES", "120")) * 60
+
+
+def analysis_params():
+    """Returns the analyzer overrides used by the pages (sampling policy and preprocessing profile)."""
+    # Imported here so opening a page does not pay for OpenCV
+    from interviewly.sampling import default_sampling
+    from interviewly.preprocess import preprocess_settings
+
+    sampling = default_sampling()
+    params = {}
+    for name in SAMPLED_ANALYZERS:
+        overrides = {}
+        if sampling is not None:
+            overrides["sampling"] = sampling
+        preprocess = preprocess_settings(PREPROCESS_PROFILE, name)
+        if preprocess is not None:
+            overrides["preprocess"] = preprocess
+        if overrides:
+            params[name] = overrides
+    return params
+
+
+@st.cache_resource
+def get_job_queue():
+    return JobQueue()
+
+
+WARMUP_LABELS = {
+    "mediapipe": "Face, pose & hand models",
+    "emotion": "Emotion model",
+    "whisper": "Speech model",
+}
+
+
+# --- Background Jobs ---
+def submit_job(kind, payload):
+    """Queues a background job (deduplicated) and makes sure workers are running."""
+    queue = get_job_queue()
+    job_id = queue.submit(kind, payload)
+    ensure_workers(queue)
+    return job_id
+
+
+@st.cache_resource
+def startup_cleanup():
+    """Sweeps stale artifacts and enforces disk quotas once per server start, in the background."""
+    from interviewly.storage import get_storage_manager
+
+    thread = threading.Thread(target=get_storage_manager().cleanup, name="interviewly-cleanup", daemon=True)
+    thread.start()
+    return thread
+
+
+def start_background_workers():
+    """Starts the workers (which warm up the models) without blocking the page."""
+    startup_cleanup()
+    ensure_workers(get_job_queue())
+
+
+def readiness_indicator():
+    """Shows in the sidebar which models the workers have loaded."""
+    status = get_job_queue().warmup_status()
+    with st.sidebar:
+        if status and all(state == "ready" for state in status.values()) and len(status) == len(WARMUP_LABELS):
+            st.caption("🟢 Models ready")
+            return
+        st.caption("🟡 Models warming up; analysis can start now and will pick them up.")
+        for model, label in WARMUP_LABELS.items():
+            state = status.get(model, "loading")
+            icon = {"ready": "✅", "loading": "⏳", "failed": "⚠️"}[state]
+            st.caption(f"{icon} {label}")
+
+
+def submit_video_analysis(video_path):
+    """Queues the fused vision analysis for a video; returns the job id."""
+    from interviewly.storage import get_storage_manager
+
+    get_storage_manager().touch(video_path)
+    return submit_job("video", {"video_path": os.path.abspath(video_path), "params": analysis_params()})
+
+
+def wait_for_job(job_id, on_update=None, timeout=JOB_WAIT_SECONDS):
+    """Polls a job until it finishes, showing a progress bar; returns the final job dict.
+
+    Leaving the page does not cancel the job: it keeps running in a worker
+    and the next visit picks up its progress or result. While waiting, dead
+    workers are restarted; after ``timeout`` seconds the job is returned as
+    failed so the page stops polling.
+    """
+    queue = get_job_queue()
+    progress_bar = st.progress(0.0, text="⏳ Queued...")
+    started = last_check = time.monotonic()
+    while True:
+        job = queue.get(job_id)
+        if job["state"] in ("done", "failed"):
+            progress_bar.empty()
+            return job
+        if time.monotonic() - started > timeout:
+            progress_bar.empty()
+            return dict(job, state="failed", error=(
+                f"Still not finished after {timeout / 60:.0f} minutes. "
+                "It keeps running in the background; reload the page to check again."
+            ))
+        if time.monotonic() - last_check > WORKER_CHECK_SECONDS:
+            ensure_workers(queue)
+            last_check = time.monotonic()
+        if job["state"] == "running":
+            progress_bar.progress(job["progress"], text=f"⚙️ Processing... {job['progress'] * 100:.0f}%")
+        if on_update and job["partial"]:
+            on_update(job["partial"])
+        time.sleep(POLL_SECONDS)
+
+
+def get_video_analysis(video_path):
+    """Returns all analyzer results for the video, computed once by a background worker."""
+    job = wait_for_job(submit_video_analysis(video_path))
+    if job["state"] == "failed":
+        st.error(f"⚠️ Analysis failed: {job['error']}")
+        st.stop()
+    performance_panel(job["result"].get("performance"))
+    return job["result"]
+
+
+# --- Performance Panel ---
+def performance_panel(performance):
+    """Shows the stage timings of an analysis run in a collapsed expander."""
+    if not performance:
+        return
+    with st.expander("⏱️ Performance"):
+        stages = performance["stages"]
+        total = stages.get("total", {}).get("total")
+        frames = stages.get("frame", {}).get("count")
+        audio_seconds = performance.get("audio_seconds")
+
+        columns = st.columns(3)
+        if total:
+            columns[0].metric("Total Time", f"{total:.1f} s")
+        if frames and total:
+            columns[1].metric("Frames / sec", f"{frames / total:.1f}")
+        if audio_seconds and total:
+            columns[2].metric("Real-Time Factor", f"{total / audio_seconds:.2f}")
+
+        st.table([
+            {
+                "Stage": stage,
+                "Calls": stats["count"],
+                "Total (s)": f"{stats['total']:.2f}",
+                "p50 (ms)": f"{stats['p50'] * 1000:.1f}",
+                "p90 (ms)": f"{stats['p90'] * 1000:.1f}",
+                "p99 (ms)": f"{stats['p99'] * 1000:.1f}",
+                "Calls / sec": f"{stats['rate']:.1f}" if stats["rate"] else "-",
+            }
+            for stage, stats in sorted(stages.items(), key=lambda item: -item[1]["total"])
+        ])
+        if performance.get("cached_analyzers"):
+            st.caption(f"{performance['cached_analyzers']} analyzer result(s) came from the cache.")
@@ -0,0 +1,234 @@
+import os
+import logging
+import tempfile
+import threading
+import subprocess
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+PCM_CHUNK_BYTES = 64 * 1024  # 2 s of 16 kHz mono s16le
+LONG_AUDIO_SECONDS = 10 * 60  # above this, transcribe_audio() fans chunks out to worker processes
+MAX_CHUNK_SECONDS = 60
+
+Segment = namedtuple("Segment", ["start", "end", "text", "words"], defaults=((),))
+
+# --- Transcription Speed Tiers ---
+TRANSCRIPTION_PROFILES = {
+    "fast": {"model_size": "base", "beam_size": 1},
+    "balanced": {"model_size": "small", "beam_size": 1},
+    "accurate": {"model_size": "small", "beam_size": 5},
+}
+
+
+def check_profile(name):
+    """Returns ``name`` if it is a transcription profile, else raises a ValueError listing the valid ones."""
+    if name not in TRANSCRIPTION_PROFILES:
+        raise ValueError(f"Unknown transcription profile: {name!r} (expected one of {', '.join(TRANSCRIPTION_PROFILES)})")
+    return name
+
+
+DEFAULT_PROFILE = check_profile(os.environ.get("INTERVIEWLY_TRANSCRIPTION_PROFILE", "accurate"))
+
+
+def transcription_profile(name=None):
+    """Returns the settings of a named profile (default: the host-wide profile)."""
+    return TRANSCRIPTION_PROFILES[check_profile(name or DEFAULT_PROFILE)]
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level Levenshtein distance divided by the reference length."""
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+    return previous[-1] / len(ref)
+
+
+class AudioExtractionError(Exception):
+    """Raised when ffmpeg cannot produce an audio stream from the video."""
+
+
+# --- Pipe-Based Audio Extraction ---
+def stream_audio(video_path, chunk_bytes=PCM_CHUNK_BYTES):
+    """Yields 16 kHz mono float32 chunks decoded by ffmpeg straight from its stdout.
+
+    Nothing touches disk, and the first chunk is available as soon as ffmpeg
+    has decoded it, so consumers can start before extraction finishes.
+    """
+    ffmpeg_cmd = [
+        'ffmpeg',
+        '-nostdin',
+        '-i', video_path,
+        '-vn',
+        '-acodec', 'pcm_s16le',
+        '-ar', str(SAMPLE_RATE),
+        '-ac', '1',
+        '-f', 's16le',
+        '-loglevel', 'error',
+        'pipe:1'
+    ]
+
+    # stderr goes to a file: a pipe nobody reads until stdout ends can fill up and stall ffmpeg
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        remainder = b""
+        try:
+            while True:
+                data = process.stdout.read(chunk_bytes)
+                if not data:
+                    break
+                data = remainder + data
+                usable = len(data) - len(data) % 2
+                remainder = data[usable:]
+                yield np.frombuffer(data[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+
+        if returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode("utf-8", errors="replace")
+            logger.error(f"FFmpeg error: {stderr}")
+            raise AudioExtractionError(stderr)
+
+
+def extract_audio(video_path):
+    """Returns the whole audio track as one 16 kHz mono float32 array."""
+    chunks = list(stream_audio(video_path))
+    audio = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+    if audio.size == 0:
+        raise AudioExtractionError("Empty audio generated - possibly no audio stream")
+    return audio
+
+
+# --- Parallel Chunked Transcription ---
+def split_on_silence(audio, max_chunk_seconds=MAX_CHUNK_SECONDS, min_silence_duration_ms=500):
+    """Groups Silero VAD speech regions into chunks of at most ``max_chunk_seconds``.
+
+    Returns ``(start, end)`` sample ranges whose boundaries all fall in
+    silence, so no word is cut between two chunks. A single speech region
+    longer than the limit is kept whole.
+    """
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+    regions = get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=min_silence_duration_ms))
+    max_samples = int(max_chunk_seconds * SAMPLE_RATE)
+    chunks = []
+    for region in regions:
+        if chunks and region["end"] - chunks[-1][0] <= max_samples:
+            chunks[-1] = (chunks[-1][0], region["end"])
+        else:
+            chunks.append((region["start"], region["end"]))
+    return chunks
+
+
+_worker_model = None
+
+
+def _init_worker(model_size, compute_type, cpu_threads):
+    """Loads one Whisper model per worker process."""
+    global _worker_model
+    from faster_whisper import WhisperModel
+
+    _worker_model = WhisperModel(model_size, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads)
+
+
+def word_tuples(segment, offset=0.0):
+    """Returns a faster-whisper segment's words as ``(word, start, end)`` tuples."""
+    return tuple((word.word, offset + word.start, offset + word.end) for word in segment.words or ())
+
+
+def _transcribe_chunk(offset, audio, beam_size):
+    """Transcribes one chunk in a worker and shifts its timestamps by ``offset`` seconds."""
+    segments, _ = _worker_model.transcribe(audio, beam_size=beam_size, word_timestamps=True)
+    return [
+        Segment(offset + segment.start, offset + segment.end, segment.text, word_tuples(segment, offset))
+        for segment in segments
+    ]
+
+
+def iter_transcribe_parallel(audio, model_size="small", compute_type="int8", beam_size=5, workers=None,
+                             max_chunk_seconds=MAX_CHUNK_SECONDS, cpus=None):
+    """Transcribes long audio by cutting it at silences and decoding chunks in worker processes.
+
+    ``cpus`` is the number of cores this call may use (default all of them);
+    there are at most that many workers, each holding its own model and an
+    equal share of the cores. Yields the timestamped segments in order, as
+    soon as each chunk and all chunks before it are done.
+    """
+    chunks = split_on_silence(audio, max_chunk_seconds)
+    if not chunks:
+        return
+
+    cpus = cpus or os.cpu_count() or 1
+    workers = max(1, min(workers or cpus, cpus, len(chunks)))
+    cpu_threads = max(1, cpus // workers)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(model_size, compute_type, cpu_threads)
+    ) as executor:
+        futures = [
+            executor.submit(_transcribe_chunk, start / SAMPLE_RATE, audio[start:end], beam_size)
+            for start, end in chunks
+        ]
+        for future in futures:
+            yield from future.result()
+
+
+# --- In-Process Transcription ---
+_models = {}
+_models_lock = threading.Lock()
+
+
+def load_model(model_size):
+    """Returns a process-wide WhisperModel for the given size, loading it on first use."""
+    with _models_lock:
+        if model_size not in _models:
+            from faster_whisper import WhisperModel
+
+            _models[model_size] = WhisperModel(model_size, device="cpu", compute_type="int8")
+        return _models[model_size]
+
+
+def iter_transcribe(audio, profile=None, cpus=None):
+    """Yields Segments with word timestamps as they are decoded, using a named profile.
+
+    Audio longer than LONG_AUDIO_SECONDS is chunked at silences and decoded
+    across worker processes (on at most ``cpus`` cores); shorter audio uses
+    the in-process model.
+    """
+    settings = transcription_profile(profile)
+    if len(audio) / SAMPLE_RATE > LONG_AUDIO_SECONDS:
+        yield from iter_transcribe_parallel(audio, model_size=settings["model_size"], beam_size=settings["beam_size"],
+                                            cpus=cpus)
+        return
+
+    segments, _ = load_model(settings["model_size"]).transcribe(
+        audio,
+        beam_size=settings["beam_size"],
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500),
+        word_timestamps=True
+    )
+    for segment in segments:
+        yield Segment(segment.start, segment.end, segment.text, word_tuples(segment))
@@ -0,0 +1,251 @@
+import os
+import time
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+
+from interviewly.cache import CACHE_DIR, remember_hash
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_DIR = "uploaded_videos"
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_QUOTA_BYTES = int(os.environ.get("INTERVIEWLY_UPLOAD_QUOTA_MB", "4096")) * 1024 * 1024
+SCRATCH_DIR = os.environ.get("INTERVIEWLY_SCRATCH_DIR", os.path.join(".cache", "scratch"))
+SCRATCH_MAX_AGE_SECONDS = 6 * 60 * 60  # scratch left by a crashed run is swept after this
+PARTIAL_MAX_AGE_SECONDS = 60 * 60  # interrupted upload (.part) files
+# Uploads used this recently (stored, re-uploaded, analyzed, or read by a finished job) are never evicted
+UPLOAD_GRACE_SECONDS = float(os.environ.get("INTERVIEWLY_UPLOAD_GRACE_MINUTES", "60")) * 60
+LOG_MAX_BYTES = int(os.environ.get("INTERVIEWLY_LOG_MAX_MB", "50")) * 1024 * 1024
+
+
+# --- Content-Addressed Uploads ---
+def store_upload(fileobj, filename, upload_dir=UPLOAD_DIR, chunk_size=UPLOAD_CHUNK_SIZE):
+    """Streams an upload to disk in fixed-size chunks and stores it under its SHA-256.
+
+    Identical uploads map to the same file, so a re-upload is deduplicated and
+    two users uploading ``interview.mp4`` never overwrite each other.
+    Returns ``(path, sha256)``.
+    """
+    os.makedirs(upload_dir, exist_ok=True)
+    suffix = os.path.splitext(filename)[1].lower() or ".mp4"
+    digest = hashlib.sha256()
+
+    if hasattr(fileobj, "seek"):
+        fileobj.seek(0)
+
+    fd, tmp_path = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+                digest.update(chunk)
+                f.write(chunk)
+
+        video_hash = digest.hexdigest()
+        video_path = os.path.join(upload_dir, f"{video_hash}{suffix}")
+        if os.path.exists(video_path):
+            os.remove(tmp_path)
+            mark_used(video_path)  # a re-upload counts as a use for LRU eviction
+        else:
+            os.replace(tmp_path, video_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    remember_hash(video_path, video_hash)
+    get_storage_manager().enforce_upload_quota(keep=(video_path,))
+    return video_path, video_hash
+
+
+def mark_used(path):
+    """Marks a file as used now through its access time; the mtime, which keys the hash memo, is kept."""
+    os.utime(path, ns=(time.time_ns(), os.stat(path).st_mtime_ns))
+
+
+def last_used(stat):
+    """LRU recency of a file: its last write, or a later mark_used()."""
+    return max(stat.st_atime, stat.st_mtime)
+
+
+def remove_tree(path):
+    shutil.rmtree(path, ignore_errors=True)
+
+
+# --- Disk Lifecycle ---
+def tree_usage(path):
+    """Returns ``(bytes, files)`` under a directory (0, 0 if it does not exist)."""
+    total = files = 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+                files += 1
+            except FileNotFoundError:
+                continue
+    return total, files
+
+
+class StorageManager:
+    """Owns every directory the app writes to: reports usage and keeps it bounded.
+
+    Uploads are evicted least recently used (see last_used(); re-uploads and
+    analyses count as uses) once they exceed ``upload_quota``. Never evicted are videos
+    with queued or running jobs, videos of jobs finished within
+    ``upload_grace`` seconds, and uploads used within that grace period, so an
+    upload stored by one session but not yet submitted cannot be removed by
+    another session's upload. The result cache and landmark store keep
+    their own LRU limits and are evicted here as well; scratch directories,
+    interrupted uploads, old finished jobs and an oversized worker log are
+    removed by cleanup().
+    """
+
+    def __init__(self, upload_dir=UPLOAD_DIR, upload_quota=UPLOAD_QUOTA_BYTES, scratch_dir=SCRATCH_DIR,
+                 upload_grace=UPLOAD_GRACE_SECONDS):
+        self.upload_dir = upload_dir
+        self.upload_quota = upload_quota
+        self.upload_grace = upload_grace
+        self.scratch_dir = scratch_dir
+        self.lock = threading.Lock()
+
+    def areas(self):
+        from interviewly.jobs import WORKER_LOG, JOBS_DB
+        from interviewly.metrics import METRICS_DIR
+        from interviewly.landmarks import LANDMARK_DIR
+
+        return {
+            "uploads": self.upload_dir,
+            "results": CACHE_DIR,
+            "landmarks": LANDMARK_DIR,
+            "scratch": self.scratch_dir,
+            "metrics": METRICS_DIR,
+            "jobs": JOBS_DB,
+            "logs": WORKER_LOG,
+        }
+
+    def usage(self):
+        """Returns ``{area: {"path", "bytes", "files"}}`` plus a ``total`` entry in bytes."""
+        report = {}
+        for area, path in self.areas().items():
+            if os.path.isdir(path):
+                size, files = tree_usage(path)
+            else:
+                size, files = (os.path.getsize(path), 1) if os.path.exists(path) else (0, 0)
+            report[area] = {"path": path, "bytes": size, "files": files}
+        report["total"] = sum(entry["bytes"] for entry in report.values())
+        report["upload_quota"] = self.upload_quota
+        return report
+
+    def touch(self, video_path):
+        """Marks an upload as recently used."""
+        try:
+            mark_used(video_path)
+        except FileNotFoundError:
+            pass
+
+    def enforce_upload_quota(self, keep=()):
+        """Deletes least recently used uploads until the upload directory fits its quota."""
+        if not os.path.isdir(self.upload_dir):
+            return []
+        protected = {os.path.abspath(path) for path in keep} | self._videos_in_use(self.upload_grace)
+        recent = time.time() - self.upload_grace
+        with self.lock:
+            entries = []
+            for name in os.listdir(self.upload_dir):
+                path = os.path.join(self.upload_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((last_used(stat), stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            evicted = []
+            for used, size, path in sorted(entries):
+                if total <= self.upload_quota:
+                    break
+                if os.path.abspath(path) in protected or path.endswith(".part") or used > recent:
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                evicted.append(path)
+        if total > self.upload_quota:
+            logger.warning(f"Uploads use {total} bytes, over the {self.upload_quota} byte quota, but the rest are in use")
+        for path in evicted:
+            logger.info(f"Evicted upload {path} (upload quota {self.upload_quota} bytes)")
+        return evicted
+
+    @staticmethod
+    def _videos_in_use(recent_seconds):
+        from interviewly.jobs import JobQueue
+
+        try:
+            return {os.path.abspath(path) for path in JobQueue().active_videos(recent_seconds)}
+        except Exception as e:
+            logger.warning(f"Could not read active jobs, evicting without protection: {e}")
+            return set()
+
+    def cleanup(self):
+        """Startup/periodic sweep: stale scratch and partial uploads, old jobs, big logs, quotas.
+
+        Safe to run while workers are busy: only artifacts older than their
+        max age are removed. Returns the usage report after cleaning.
+        """
+        now = time.time()
+        if os.path.isdir(self.scratch_dir):
+            for name in os.listdir(self.scratch_dir):
+                path = os.path.join(self.scratch_dir, name)
+                try:
+                    if now - os.path.getmtime(path) <= SCRATCH_MAX_AGE_SECONDS:
+                        continue
+                    if os.path.isdir(path):
+                        remove_tree(path)
+                    else:
+                        os.remove(path)
+                except FileNotFoundError:
+                    continue
+
+        if os.path.isdir(self.upload_dir):
+            for name in os.listdir(self.upload_dir):
+                path = os.path.join(self.upload_dir, name)
+                try:
+                    if name.endswith(".part") and now - os.path.getmtime(path) > PARTIAL_MAX_AGE_SECONDS:
+                        os.remove(path)
+                except FileNotFoundError:
+                    continue
+
+        from interviewly.jobs import JobQueue, WORKER_LOG
+        from interviewly.cache import get_cache
+        from interviewly.landmarks import get_landmark_store
+
+        try:
+            JobQueue().prune()
+        except Exception as e:
+            logger.warning(f"Could not prune old jobs: {e}")
+        try:
+            if os.path.getsize(WORKER_LOG) > LOG_MAX_BYTES:
+                # Workers append with O_APPEND, so truncating in place is safe
+                os.truncate(WORKER_LOG, 0)
+        except FileNotFoundError:
+            pass
+
+        self.enforce_upload_quota()
+        get_cache().evict()
+        get_landmark_store().evict()
+        return self.usage()
+
+
+_default_manager = None
+
+
+def get_storage_manager():
+    """Returns the process-wide storage manager."""
+    global _default_manager
+    if _default_manager is None:
+        _default_manager = StorageManager()
+    return _default_manager
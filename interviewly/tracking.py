@@ -0,0 +1,103 @@
+import logging
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def fit_face(face, size):
+    """Scales a BGR face crop to ``size`` the way DeepFace's ``extract_faces`` does.
+
+    The face is resized keeping its aspect ratio, zero-padded evenly to
+    ``size`` and returned as float32 in 0..1, so tracked crops reach the
+    emotion model in the same form as detected ones.
+    """
+    width, height = size
+    factor = min(height / face.shape[0], width / face.shape[1])
+    face = cv2.resize(face, (max(1, int(face.shape[1] * factor)), max(1, int(face.shape[0] * factor))))
+    pad_y, pad_x = height - face.shape[0], width - face.shape[1]
+    face = np.pad(face, ((pad_y // 2, pad_y - pad_y // 2), (pad_x // 2, pad_x - pad_x // 2), (0, 0)), "constant")
+    return face.astype(np.float32) / 255
+
+
+# --- Detect-Once-Then-Track Face Locator ---
+class FaceTracker:
+    """Runs the face detector on keyframes and follows the box between them.
+
+    Between keyframes the face is tracked by normalized template matching in a
+    window around the previous box, which costs a fraction of a detection. The
+    detector runs again every ``keyframe_interval`` frames, or as soon as the
+    match score drops below ``min_confidence``.
+    """
+
+    def __init__(self, keyframe_interval=15, min_confidence=0.6, search_margin=0.5, detector_backend="opencv"):
+        self.keyframe_interval = keyframe_interval
+        self.min_confidence = min_confidence
+        self.search_margin = search_margin
+        self.detector_backend = detector_backend
+        from deepface.detectors import FaceDetector
+
+        self.detector = FaceDetector.build_model(detector_backend)
+        self.box = None
+        self.template = None
+        self.frames_since_detection = 0
+        self.detections = 0
+        self.tracked = 0
+
+    def _detect(self, frame, gray):
+        self.detections += 1
+        self.frames_since_detection = 0
+        from deepface.detectors import FaceDetector
+
+        try:
+            faces = FaceDetector.detect_faces(self.detector, self.detector_backend, frame, align=False)
+        except Exception as e:
+            logger.warning(f"Face detection failed: {e}")
+            faces = []
+
+        if not faces:
+            self.box = None
+            self.template = None
+            return None
+
+        x, y, w, h = [int(v) for v in faces[0][1]]
+        self.box = (x, y, w, h)
+        self.template = gray[y:y + h, x:x + w].copy()
+        return self.box
+
+    def _track(self, gray):
+        x, y, w, h = self.box
+        margin_x, margin_y = int(w * self.search_margin), int(h * self.search_margin)
+        x0, y0 = max(0, x - margin_x), max(0, y - margin_y)
+        x1, y1 = min(gray.shape[1], x + w + margin_x), min(gray.shape[0], y + h + margin_y)
+        window = gray[y0:y1, x0:x1]
+        if window.shape[0] < h or window.shape[1] < w:
+            return None, 0.0
+
+        scores = cv2.matchTemplate(window, self.template, cv2.TM_CCOEFF_NORMED)
+        _, confidence, _, location = cv2.minMaxLoc(scores)
+        return (x0 + location[0], y0 + location[1], w, h), confidence
+
+    def update(self, frame):
+        """Returns the face box ``(x, y, w, h)`` in this BGR frame, or None."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        self.frames_since_detection += 1
+        if self.box is None or self.frames_since_detection >= self.keyframe_interval:
+            return self._detect(frame, gray)
+
+        box, confidence = self._track(gray)
+        if box is None or confidence < self.min_confidence:
+            return self._detect(frame, gray)
+
+        self.tracked += 1
+        self.box = box
+        return box
+
+    def crop(self, frame, size):
+        """Returns the tracked face fitted to ``size`` (float32, 0..1, see fit_face), or None when no face is visible."""
+        box = self.update(frame)
+        if box is None:
+            return None
+        x, y, w, h = box
+        return fit_face(frame[y:y + h, x:x + w], size)
@@ -0,0 +1,68 @@
+"""Background model warm-up for the analysis workers.
+
+Loading TensorFlow with the DeepFace emotion model, building the MediaPipe
+graphs and loading Whisper each take seconds. A worker starts these in a
+background thread as soon as it starts, so the first analysis finds the
+models already in memory. Progress is published through the job store and
+shown by the pages as a readiness indicator.
+"""
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def warm_mediapipe():
+    """Builds one graph per analyzer into the process-wide pools (see interviewly.graphs)."""
+    from interviewly.analyzers import EyeContactAnalyzer, PostureAnalyzer, GestureAnalyzer
+
+    for cls in (EyeContactAnalyzer, PostureAnalyzer, GestureAnalyzer):
+        cls().close()
+
+
+def warm_emotion():
+    """Imports TensorFlow and loads the emotion classifier and the face detector."""
+    import numpy as np
+    from deepface import DeepFace
+    from deepface.detectors import FaceDetector
+
+    model = DeepFace.build_model("Emotion")
+    model.predict(np.zeros((1, 48, 48, 1), dtype=np.float32), verbose=0)
+    FaceDetector.build_model("opencv")
+
+
+def warm_whisper():
+    """Loads the Whisper model of the host-wide transcription profile."""
+    from interviewly import speech
+
+    speech.load_model(speech.transcription_profile()["model_size"])
+
+
+WARMUP_TASKS = {
+    "mediapipe": warm_mediapipe,
+    "emotion": warm_emotion,
+    "whisper": warm_whisper,
+}
+
+
+def run_warmup(on_state=None, tasks=WARMUP_TASKS):
+    """Runs the warm-up tasks in order, reporting ``on_state(name, state)`` with loading/ready/failed."""
+    for name, task in tasks.items():
+        if on_state:
+            on_state(name, "loading")
+        try:
+            task()
+            state = "ready"
+        except Exception as e:
+            # Warm-up is best effort; the job loads the model itself and reports real errors
+            logger.warning(f"Warm-up of {name} failed: {e}")
+            state = "failed"
+        if on_state:
+            on_state(name, state)
+
+
+def start_warmup(on_state=None):
+    """Starts run_warmup() on a daemon thread and returns the thread."""
+    thread = threading.Thread(target=run_warmup, args=(on_state,), name="interviewly-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -1,11 +1,8 @@
 import streamlit as st
-import cv2
 import os
-import tempfile
-import numpy as np
-import matplotlib.pyplot as plt
-from deepface import DeepFace
-from concurrent.futures import ThreadPoolExecutor
+
+from interviewly.charts import pie_chart, count_labels
+from interviewly.session import get_video_analysis
 
 # --- Page Configuration ---
 st.set_page_config(page_title="Emotion Detection", page_icon="😊", layout="wide")
@@ -66,70 +63,24 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# --- Extract Frames from Video ---
-def extract_frames(video_path, frame_rate=5):
-    """Extracts frames from the video at a given frame rate."""
-    temp_dir = tempfile.mkdtemp()
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
-        st.error(f"⚠️ Error opening video file: {video_path}. Please check the path and try again.")
-        return []
-
-    fps = int(cap.get(cv2.CAP_PROP_FPS))
-    frame_interval = max(1, fps // frame_rate)
-    frame_count = 0
-    saved_frames = []
-
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-        if frame_count % frame_interval == 0:
-            frame_path = os.path.join(temp_dir, f"frame_{frame_count}.jpg")
-            cv2.imwrite(frame_path, frame)
-            saved_frames.append(frame_path)
-        frame_count += 1
-
-    cap.release()
-    return saved_frames
-
-# --- Detect Emotions ---
-def analyze_frame(frame):
-    """Detects emotions in a single frame using DeepFace."""
-    try:
-        analysis = DeepFace.analyze(frame, actions=["emotion"], enforce_detection=False)
-        dominant_emotion = analysis[0]["dominant_emotion"]
-        return dominant_emotion
-    except Exception as e:
-        st.warning(f"⚠️ Error analyzing frame: {e}")
-        return "No Face Detected"
-
-def analyze_emotions_parallel(frames):
-    """Runs emotion detection in parallel for faster speed."""
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        results = list(executor.map(analyze_frame, frames))
-    return results
+EMOTION_COLORS = ["#ff9999", "#66b3ff", "#99ff99", "#ffcc99", "#c2c2f0", "#ffb3e6"]
 
 # --- Generate Emotion Distribution Report ---
 def generate_emotion_report(emotions):
     """Generates and displays emotion distribution report."""
-    emotion_counts = {emotion: emotions.count(emotion) for emotion in set(emotions)}
-    sorted_emotions = sorted(emotion_counts.items(), key=lambda x: x[1], reverse=True)
+    sorted_emotions = count_labels(emotions)
 
     if sorted_emotions:
         dominant_emotion, count = sorted_emotions[0]
         st.markdown(f"### **😊 Dominant Emotion: `{dominant_emotion.upper()}`**")
 
         # --- Display Emotion Distribution as a Pie Chart ---
-        plt.figure(figsize=(6, 6))
-        plt.pie(
-            emotion_counts.values(), 
-            labels=emotion_counts.keys(), 
-            autopct='%1.1f%%', 
-            colors=["#ff9999","#66b3ff","#99ff99","#ffcc99","#c2c2f0","#ffb3e6"]
-        )
-        plt.title("Emotion Distribution")
-        st.pyplot(plt)
+        st.image(pie_chart(
+            [emotion for emotion, _ in sorted_emotions],
+            [count for _, count in sorted_emotions],
+            EMOTION_COLORS,
+            "Emotion Distribution"
+        ), use_column_width=True)
 
         # --- Display Distribution Details ---
         st.markdown("**📊 Emotion Breakdown:**")
@@ -162,11 +113,13 @@ else:
     st.video(video_path)
     st.write("Processing... This may take a few seconds.")
 
-    # Extract Frames & Analyze Emotions
-    frames = extract_frames(video_path, frame_rate=5)
-    if frames:
-        emotions = analyze_emotions_parallel(frames)
+    # Analyze Emotions (frames are sampled from the shared single-decode pipeline)
+    emotions = get_video_analysis(video_path)["emotion"]
+    if not emotions:
+        st.error(f"⚠️ Error opening video file: {video_path}. Please check the path and try again.")
+    else:
         st.success("✅ Emotion Analysis Complete!")
+        emotion_counts = count_labels(emotions)
 
         # --- Row 1: Graph and Emotion Breakdown ---
         row1_col1, row1_col2 = st.columns(2)
@@ -174,20 +127,17 @@ else:
         with row1_col1:
             # --- Display Pie Chart ---
             st.markdown("### 📊 Emotion Distribution")
-            plt.figure(figsize=(6, 6))
-            plt.pie(
-                [emotions.count(emotion) for emotion in set(emotions)],
-                labels=set(emotions),
-                autopct='%1.1f%%',
-                colors=["#ff9999","#66b3ff","#99ff99","#ffcc99","#c2c2f0","#ffb3e6"]
-            )
-            plt.title("Emotion Distribution")
-            st.pyplot(plt)
+            st.image(pie_chart(
+                [emotion for emotion, _ in emotion_counts],
+                [count for _, count in emotion_counts],
+                EMOTION_COLORS,
+                "Emotion Distribution"
+            ), use_column_width=True)
 
         with row1_col2:
             # --- Display Emotion Breakdown ---
             st.markdown("### 📝 Emotion Breakdown")
-            for emotion, count in {emotion: emotions.count(emotion) for emotion in set(emotions)}.items():
+            for emotion, count in emotion_counts:
                 st.markdown(f"""
                     <div class="analysis-card">
                         <h3>{emotion.capitalize()}</h3>
@@ -1,14 +1,8 @@
 import streamlit as st
-import cv2
-import mediapipe as mp
-import numpy as np
-import tempfile
 import os
-import matplotlib.pyplot as plt
 
-# --- Initialize MediaPipe Face Mesh ---
-mp_face_mesh = mp.solutions.face_mesh
-face_mesh = mp_face_mesh.FaceMesh(static_image_mode=False, max_num_faces=1, min_detection_confidence=0.5)
+from interviewly.charts import pie_chart
+from interviewly.session import get_video_analysis
 
 # --- Page Configuration ---
 st.set_page_config(page_title="Eye Contact Detection", page_icon="👀", layout="wide")
@@ -71,42 +65,8 @@ st.markdown("""
 
 # --- Function to Process Video and Detect Eye Contact ---
 def process_video(video_path):
-    """Extract frames from video and analyze eye contact."""
-    cap = cv2.VideoCapture(video_path)
-    frame_count = 0
-    eye_contact_frames = 0
-    total_frames = 0
-
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        # Convert frame to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = face_mesh.process(frame_rgb)
-
-        if results.multi_face_landmarks:
-            for face_landmarks in results.multi_face_landmarks:
-                # Get eye landmarks
-                left_eye = [33, 133]  # Left eye inner & outer corners
-                right_eye = [362, 263]  # Right eye inner & outer corners
-                nose = 1  # Nose tip (used for center reference)
-
-                left_eye_x = (face_landmarks.landmark[left_eye[0]].x + face_landmarks.landmark[left_eye[1]].x) / 2
-                right_eye_x = (face_landmarks.landmark[right_eye[0]].x + face_landmarks.landmark[right_eye[1]].x) / 2
-                nose_x = face_landmarks.landmark[nose].x
-
-                # Check if eyes are centered (looking straight at camera)
-                if abs(left_eye_x - nose_x) < 0.05 and abs(right_eye_x - nose_x) < 0.05:
-                    eye_contact_frames += 1  # Eye contact maintained
-
-        total_frames += 1
-    cap.release()
-
-    # Calculate Eye Contact Score (as a percentage)
-    eye_contact_score = (eye_contact_frames / total_frames) * 100 if total_frames > 0 else 0
-    return eye_contact_score, eye_contact_frames, total_frames
+    """Analyze eye contact using the shared single-decode pipeline."""
+    return get_video_analysis(video_path)["eyecontact"]
 
 # --- Page UI ---
 st.markdown('<p class="title">👀 Eye Contact Detection</p>', unsafe_allow_html=True)
@@ -122,7 +82,7 @@ else:
     st.write("Processing... This may take a few seconds.")
 
     # Process Video
-    eye_contact_score, eye_contact_frames, total_frames = process_video(video_path)
+    eye_contact_score, eye_contact_frames, total_frames, sampled_frames = process_video(video_path)
 
     # --- Display Eye Contact Report ---
     st.success("✅ Eye Contact Analysis Complete!")
@@ -138,10 +98,7 @@ else:
         values = [eye_contact_frames, total_frames - eye_contact_frames]
         colors = ['#66b3ff', '#ff9999']
 
-        plt.figure(figsize=(6, 6))
-        plt.pie(values, labels=labels, autopct='%1.1f%%', colors=colors)
-        plt.title("Eye Contact Distribution")
-        st.pyplot(plt)
+        st.image(pie_chart(labels, values, colors, "Eye Contact Distribution"), use_column_width=True)
 
     with row1_col2:
         # --- Display Eye Contact Breakdown ---
@@ -155,6 +112,10 @@ else:
                 <h3>Total Frames Analyzed</h3>
                 <p>{total_frames}</p>
             </div>
+            <div class="analysis-card">
+                <h3>Frames Inferred</h3>
+                <p>{sampled_frames}</p>
+            </div>
         """, unsafe_allow_html=True)
 
     # --- Row 2: Eye Contact Analysis Conditions and Improvement Tips ---
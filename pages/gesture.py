@@ -1,15 +1,8 @@
 import streamlit as st
-import cv2
-import mediapipe as mp
-import numpy as np
-import tempfile
 import os
-import matplotlib.pyplot as plt
 
-# --- Initialize MediaPipe Hand Module ---
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(static_image_mode=False, max_num_hands=2, min_detection_confidence=0.5)
+from interviewly.charts import pie_chart
+from interviewly.session import get_video_analysis
 
 # --- Page Configuration ---
 st.set_page_config(page_title="Hand Gesture Detection", page_icon="✋", layout="wide")
@@ -72,54 +65,8 @@ st.markdown("""
 
 # --- Function to Process Video and Detect Gestures ---
 def process_video(video_path):
-    """Extract frames from video and analyze hand gestures."""
-    cap = cv2.VideoCapture(video_path)
-    frame_count = 0
-    gesture_counts = {"Open Palm": 0, "Fist": 0, "Thumbs Up": 0, "Victory": 0, "No Hand": 0}
-
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        # Convert to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
-
-            # Get landmark positions to classify gesture
-            landmarks = results.multi_hand_landmarks[0].landmark
-            thumb_tip = landmarks[mp_hands.HandLandmark.THUMB_TIP].y
-            index_tip = landmarks[mp_hands.HandLandmark.INDEX_FINGER_TIP].y
-            pinky_tip = landmarks[mp_hands.HandLandmark.PINKY_TIP].y
-            wrist = landmarks[mp_hands.HandLandmark.WRIST].y
-
-            # Simple gesture classification
-            if thumb_tip < wrist and index_tip < wrist:
-                gesture = "Thumbs Up"
-            elif index_tip < wrist and pinky_tip < wrist:
-                gesture = "Victory"
-            elif all(landmarks[i].y > wrist for i in [mp_hands.HandLandmark.THUMB_TIP,
-                                                      mp_hands.HandLandmark.INDEX_FINGER_TIP,
-                                                      mp_hands.HandLandmark.PINKY_TIP]):
-                gesture = "Open Palm"
-            elif all(landmarks[i].y < wrist for i in [mp_hands.HandLandmark.THUMB_TIP,
-                                                      mp_hands.HandLandmark.INDEX_FINGER_TIP]):
-                gesture = "Fist"
-            else:
-                gesture = "No Hand"
-
-            gesture_counts[gesture] += 1
-        else:
-            gesture_counts["No Hand"] += 1
-
-        frame_count += 1
-    cap.release()
-
-    return gesture_counts
+    """Analyze hand gestures using the shared single-decode pipeline."""
+    return get_video_analysis(video_path)["gesture"]
 
 # --- Page UI ---
 st.markdown('<p class="title">✋ Hand Gesture Detection</p>', unsafe_allow_html=True)
@@ -140,7 +87,7 @@ else:
     st.write("Processing... This may take a few seconds.")
 
     # Process Video
-    gesture_distribution = process_video(video_path)
+    gesture_distribution, sampled_frames = process_video(video_path)
 
     # --- Display Gesture Report ---
     st.success("✅ Gesture Analysis Complete!")
@@ -152,19 +99,17 @@ else:
     with row1_col1:
         # --- Display Pie Chart ---
         st.markdown("### 📊 Gesture Distribution")
-        plt.figure(figsize=(6, 6))
-        plt.pie(
+        st.image(pie_chart(
+            gesture_distribution.keys(),
             gesture_distribution.values(),
-            labels=gesture_distribution.keys(),
-            autopct='%1.1f%%',
-            colors=["#ff9999", "#66b3ff", "#99ff99", "#ffcc99", "#c2c2f0"]
-        )
-        plt.title("Hand Gesture Distribution")
-        st.pyplot(plt)
+            ["#ff9999", "#66b3ff", "#99ff99", "#ffcc99", "#c2c2f0"],
+            "Hand Gesture Distribution"
+        ), use_column_width=True)
 
     with row1_col2:
         # --- Display Gesture Breakdown ---
         st.markdown("### 📝 Gesture Breakdown")
+        st.caption(f"Inference ran on {sampled_frames} of {sum(gesture_distribution.values())} frames.")
         for gesture, count in gesture_distribution.items():
             st.markdown(f"""
                 <div class="analysis-card">
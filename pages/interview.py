@@ -1,8 +1,10 @@
 import streamlit as st
 import os
-from moviepy.editor import VideoFileClip
 from streamlit_extras.switch_page_button import switch_page
 
+from interviewly.storage import store_upload
+from interviewly.session import submit_video_analysis, readiness_indicator
+
 # --- Page Configuration ---
 st.set_page_config(page_title="InterviewLY", page_icon="🎥", layout="wide")
 
@@ -170,16 +172,19 @@ st.subheader("📂 Upload an MP4 Video")
 uploaded_video = st.file_uploader("Drag and drop your MP4 file here", type=["mp4"], help="Limit 200MB per file. Supported formats: MP4, MPEG4")
 
 if uploaded_video is not None:
-    upload_dir = "uploaded_videos"
-    os.makedirs(upload_dir, exist_ok=True)
-    video_path = os.path.join(upload_dir, uploaded_video.name)
-    
-    with open(video_path, "wb") as f:
-        f.write(uploaded_video.read())
-    
-    st.session_state.uploaded_video_path = video_path  # Update session state
+    # Stream to content-addressed storage once per upload, not on every rerun
+    upload_id = getattr(uploaded_video, "file_id", uploaded_video.name)
+    if st.session_state.get("uploaded_video_id") != upload_id or not os.path.exists(st.session_state.uploaded_video_path or ""):
+        video_path, video_hash = store_upload(uploaded_video, uploaded_video.name)
+        st.session_state.uploaded_video_path = video_path  # Update session state
+        st.session_state.uploaded_video_hash = video_hash
+        st.session_state.uploaded_video_id = upload_id
+        # Start the vision analysis in the background while the user looks around
+        submit_video_analysis(video_path)
+    video_path = st.session_state.uploaded_video_path
     st.success("✅ Video uploaded successfully!")
     st.video(video_path)
+    readiness_indicator()
 
 st.markdown('</div>', unsafe_allow_html=True)
 
@@ -1,15 +1,8 @@
 import streamlit as st
-import cv2
-import mediapipe as mp
-import numpy as np
-import tempfile
 import os
-import matplotlib.pyplot as plt
 
-# --- Initialize MediaPipe Pose Module ---
-mp_pose = mp.solutions.pose
-mp_drawing = mp.solutions.drawing_utils
-pose = mp_pose.Pose(static_image_mode=False, min_detection_confidence=0.5, min_tracking_confidence=0.5)
+from interviewly.charts import pie_chart
+from interviewly.session import get_video_analysis
 
 # --- Page Configuration ---
 st.set_page_config(page_title="Posture Analysis", page_icon="🧍‍♂️", layout="wide")
@@ -72,42 +65,8 @@ st.markdown("""
 
 # --- Function to Process Video and Detect Posture ---
 def process_video(video_path):
-    """Extract frames from video and analyze posture."""
-    cap = cv2.VideoCapture(video_path)
-    frame_count = 0
-    straight_posture_frames = 0
-    total_frames = 0
-
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        # Convert frame to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = pose.process(frame_rgb)
-
-        if results.pose_landmarks:
-            # Get landmark positions
-            left_shoulder = results.pose_landmarks.landmark[mp_pose.PoseLandmark.LEFT_SHOULDER]
-            right_shoulder = results.pose_landmarks.landmark[mp_pose.PoseLandmark.RIGHT_SHOULDER]
-            left_hip = results.pose_landmarks.landmark[mp_pose.PoseLandmark.LEFT_HIP]
-            right_hip = results.pose_landmarks.landmark[mp_pose.PoseLandmark.RIGHT_HIP]
-
-            # Calculate shoulder and hip alignment (posture)
-            shoulder_slope = abs(left_shoulder.y - right_shoulder.y)
-            hip_slope = abs(left_hip.y - right_hip.y)
-
-            # Define threshold to classify good posture
-            if shoulder_slope < 0.05 and hip_slope < 0.05:
-                straight_posture_frames += 1  # Straight posture detected
-
-        total_frames += 1
-    cap.release()
-
-    # Calculate Posture Score (as a percentage)
-    posture_score = (straight_posture_frames / total_frames) * 100 if total_frames > 0 else 0
-    return posture_score, straight_posture_frames, total_frames
+    """Analyze posture using the shared single-decode pipeline."""
+    return get_video_analysis(video_path)["posture"]
 
 # --- Page UI ---
 st.markdown('<p class="title">🧍‍♂️ Posture Analysis</p>', unsafe_allow_html=True)
@@ -124,7 +83,7 @@ else:
     st.write("Processing... This may take a few seconds.")
 
     # Process Video
-    posture_score, straight_posture_frames, total_frames = process_video(video_path)
+    posture_score, straight_posture_frames, total_frames, sampled_frames = process_video(video_path)
 
     # --- Display Posture Report ---
     st.success("✅ Posture Analysis Complete!")
@@ -140,10 +99,7 @@ else:
         values = [straight_posture_frames, total_frames - straight_posture_frames]
         colors = ['#66b3ff', '#ff9999']
 
-        plt.figure(figsize=(6, 6))
-        plt.pie(values, labels=labels, autopct='%1.1f%%', colors=colors)
-        plt.title("Posture Distribution")
-        st.pyplot(plt)
+        st.image(pie_chart(labels, values, colors, "Posture Distribution"), use_column_width=True)
 
     with row1_col2:
         # --- Display Posture Breakdown ---
@@ -157,6 +113,10 @@ else:
                 <h3>Total Frames Analyzed</h3>
                 <p>{total_frames}</p>
             </div>
+            <div class="analysis-card">
+                <h3>Frames Inferred</h3>
+                <p>{sampled_frames}</p>
+            </div>
         """, unsafe_allow_html=True)
 
     # --- Row 2: Posture Analysis Conditions and Improvement Tips ---
@@ -1,11 +1,10 @@
 import streamlit as st
 import os
-import tempfile
-import subprocess
-from faster_whisper import WhisperModel
-from textblob import TextBlob
-import re
 import logging
+
+from interviewly import speech
+from interviewly.session import submit_job, wait_for_job, performance_panel
+from interviewly.storage import store_upload
 # First try session state
 video_path = st.session_state.get("uploaded_video_path", "uploaded_videos/converted-video.mp4")
 
@@ -80,16 +79,13 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
-# --- Load Optimized Whisper Model ---
-@st.cache_resource
-def load_model():
-    try:
-        return WhisperModel("small", device="cpu", compute_type="int8")
-    except Exception as e:
-        st.error(f"⚠️ Model loading failed: {str(e)}")
-        return None
-
-model = load_model()
+# --- Transcription Profile ---
+profile_name = st.sidebar.selectbox(
+    "⚡ Transcription speed",
+    list(speech.TRANSCRIPTION_PROFILES),
+    index=list(speech.TRANSCRIPTION_PROFILES).index(speech.DEFAULT_PROFILE),
+    help="fast: base model, greedy decoding · balanced: small model, greedy · accurate: small model, beam search"
+)
 
 # --- File Upload Section ---
 st.markdown('<p class="title">🧠 Sentiment Analysis</p>', unsafe_allow_html=True)
@@ -97,123 +93,42 @@ st.markdown("## 📤 Upload Video File")
 uploaded_file = st.file_uploader("Choose a video file", type=["mp4", "mov", "avi", "mkv"])
 
 if uploaded_file:
-    # Save to temp file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmp_file:
-        tmp_file.write(uploaded_file.read())
-        st.session_state.uploaded_video_path = tmp_file.name
-
-# --- Enhanced Audio Extraction ---
-def extract_audio(video_path):
-    """Extracts audio from video with error handling and validation"""
-    try:
-        temp_audio = tempfile.mktemp(suffix=".wav")
-
-        ffmpeg_cmd = [
-            'ffmpeg',
-            '-y',
-            '-i', video_path,
-            '-vn',
-            '-acodec', 'pcm_s16le',
-            '-ar', '16000',
-            '-ac', '1',
-            '-f', 'wav',
-            '-loglevel', 'error',
-            temp_audio
-        ]
-
-        result = subprocess.run(
-            ffmpeg_cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        if not os.path.exists(temp_audio):
-            raise Exception(f"Output file {temp_audio} was not created")
-            
-        if os.path.getsize(temp_audio) == 0:
-            os.remove(temp_audio)
-            raise Exception("Empty audio file generated - possibly no audio stream")
-
-        return temp_audio
-
-    except subprocess.CalledProcessError as e:
-        logger.error(f"FFmpeg error: {e.stderr}")
-        if "No such file or directory" in e.stderr:
-            st.error("⚠️ Input video file not found")
-        elif "Invalid data found" in e.stderr:
-            st.error("⚠️ Corrupted or unsupported video format")
-        else:
-            st.error(f"⚠️ Audio extraction failed: {e.stderr}")
-    except Exception as e:
-        logger.error(str(e))
-        st.error(f"⚠️ {str(e)}")
-    return None
+    # Stream to content-addressed storage (deduplicated with the Interview Page uploads)
+    upload_id = getattr(uploaded_file, "file_id", uploaded_file.name)
+    if st.session_state.get("uploaded_video_id") != upload_id:
+        video_path, video_hash = store_upload(uploaded_file, uploaded_file.name)
+        st.session_state.uploaded_video_path = video_path
+        st.session_state.uploaded_video_hash = video_hash
+        st.session_state.uploaded_video_id = upload_id
 
-# --- Robust Transcription ---
-def transcribe_audio(audio_path):
-    """Transcribes audio with error handling"""
-    if not model:
-        st.error("Model not loaded!")
-        return ""
-    
-    try:
-        segments, info = model.transcribe(
-            audio_path,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(min_silence_duration_ms=500)
-        )
-        transcript = " ".join(segment.text for segment in segments)
-        os.remove(audio_path)  # Cleanup temp file
-        return transcript
-    except Exception as e:
-        logger.error(f"Transcription failed: {str(e)}")
-        st.error(f"⚠️ Transcription error: {str(e)}")
-        return ""
+# --- Error Messages ---
+def describe_error(message):
+    """Turns an analysis job error into a user-facing message"""
+    if "No such file or directory" in message:
+        return "⚠️ Input video file not found"
+    elif "Invalid data found" in message:
+        return "⚠️ Corrupted or unsupported video format"
+    elif "audio" in message.lower():
+        return f"⚠️ Audio extraction failed: {message}"
+    return f"⚠️ Analysis error: {message}"
 
-# --- Enhanced Sentiment Analysis ---
-def analyze_sentiment(text):
-    """Analyzes sentiment with improved validation"""
-    if not text.strip():
-        return {
-            "Sentiment": "No Speech",
-            "Sentiment Score": 0,
-            "Hesitation Count": 0,
-            "Grammar Issues": []
-        }
+# --- Live Transcript ---
+def live_transcript():
+    """Returns a callback that renders a job's partial transcript, running filler count and sentiment"""
+    boxes = {}
 
-    try:
-        blob = TextBlob(text)
-        sentiment_score = blob.sentiment.polarity
+    def render(partial):
+        if not boxes:
+            st.markdown("### 📝 Live Transcript")
+            boxes["transcript"] = st.empty()
+            live_cols = st.columns(2)
+            boxes["fillers"] = live_cols[0].empty()
+            boxes["sentiment"] = live_cols[1].empty()
+        boxes["transcript"].text(partial["transcript"])
+        boxes["fillers"].metric("Fillers so far", partial["fillers"])
+        boxes["sentiment"].metric("Running sentiment", f"{partial.get('sentiment', 0.0):.2f}")
 
-        fillers = ["uh", "um", "like", "you know", "so", "actually", "basically"]
-        hesitation_count = sum(
-            len(re.findall(rf"\b{re.escape(filler)}\b", text, re.IGNORECASE))
-            for filler in fillers
-        )
-
-        grammar_issues = [
-            str(sentence) for sentence in blob.sentences
-            if sentence.sentiment.polarity < -0.3
-            and len(sentence.words) > 3
-        ]
-
-        return {
-            "Sentiment": "Positive" if sentiment_score > 0.1 else 
-                        "Negative" if sentiment_score < -0.1 else "Neutral",
-            "Sentiment Score": sentiment_score,
-            "Hesitation Count": hesitation_count,
-            "Grammar Issues": grammar_issues
-        }
-    except Exception as e:
-        logger.error(f"Sentiment analysis failed: {str(e)}")
-        return {
-            "Sentiment": "Error",
-            "Sentiment Score": 0,
-            "Hesitation Count": 0,
-            "Grammar Issues": []
-        }
+    return render
 
 # --- Main UI ---
 st.markdown("## 🎙️ Transcription + Sentiment Analysis")
@@ -223,21 +138,31 @@ if st.session_state.uploaded_video_path and os.path.exists(st.session_state.uplo
         st.video(st.session_state.uploaded_video_path)
 
     if st.button("🚀 Start Analysis", type="primary"):
-        with st.spinner("🔍 Extracting audio..."):
-            audio_file = extract_audio(st.session_state.uploaded_video_path)
-            
-        if audio_file:
-            with st.spinner("📝 Transcribing audio..."):
-                transcript = transcribe_audio(audio_file)
-                
+        # Runs in a background worker; reruns and page switches pick the same job up again
+        job_id = submit_job("speech", {
+            "video_path": os.path.abspath(st.session_state.uploaded_video_path),
+            "profile": profile_name
+        })
+        st.session_state.speech_job = (st.session_state.uploaded_video_path, job_id)
+
+    speech_job = st.session_state.get("speech_job")
+    if speech_job and speech_job[0] == st.session_state.uploaded_video_path:
+        job = wait_for_job(speech_job[1], on_update=live_transcript())
+
+        if job["state"] == "failed":
+            logger.error(f"Speech analysis failed: {job['error']}")
+            st.error(describe_error(job["error"]))
+        else:
+            transcript = job["result"]["transcript"]
+            words = job["result"]["words"]
+            analysis = job["result"]["analysis"]
+            performance_panel(job["result"].get("performance"))
+
             if transcript:
                 st.success("✅ Transcription Complete!")
                 with st.expander("📜 View Transcript"):
                     st.text_area("Transcript", transcript, height=150)
 
-                with st.spinner("🧠 Analyzing sentiment..."):
-                    analysis = analyze_sentiment(transcript)
-
                 # --- Display Results ---
                 st.markdown("## 📊 Analysis Results")
                 
@@ -277,6 +202,14 @@ if st.session_state.uploaded_video_path and os.path.exists(st.session_state.uplo
                     st.markdown("### 🤔 Filler Words")
                     filler_count = analysis["Hesitation Count"]
                     st.metric("Total Fillers", filler_count)
+                    if analysis.get("Fillers Per Minute"):
+                        st.metric("Fillers per Minute", f"{analysis['Fillers Per Minute']:.1f}")
+                    if analysis.get("Filler Counts"):
+                        with st.expander("View Fillers"):
+                            for filler, count in sorted(analysis["Filler Counts"].items(), key=lambda x: x[1], reverse=True):
+                                st.write(f"**{filler}**: {count}")
+                            if words:
+                                st.caption(", ".join(f"{phrase} @ {start:.1f}s" for phrase, start, _ in analysis["Filler Positions"]))
                     if filler_count > 5:
                         st.error("Too many filler words! Practice speaking more deliberately.")
                     elif filler_count > 0:
@@ -0,0 +1,67 @@
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+
+from interviewly.emotion import EMOTION_INPUT_SIZE, check_crops, face_crop
+from interviewly.tracking import fit_face
+
+
+def deepface_crop(face, target_size):
+    """DeepFace ``extract_faces`` post-processing, transcribed: fit inside the target, pad evenly, scale to 0..1."""
+    factor = min(target_size[0] / face.shape[0], target_size[1] / face.shape[1])
+    resized = cv2.resize(face, (int(face.shape[1] * factor), int(face.shape[0] * factor)))
+    diff_0, diff_1 = target_size[0] - resized.shape[0], target_size[1] - resized.shape[1]
+    padded = np.pad(resized, ((diff_0 // 2, diff_0 - diff_0 // 2), (diff_1 // 2, diff_1 - diff_1 // 2), (0, 0)), "constant")
+    return padded.astype(np.float32) / 255
+
+
+def detected_crop(monkeypatch, face):
+    """Runs face_crop with extract_faces replaced by its documented output (deepface_crop)."""
+    def extract_faces(img, target_size, **kwargs):
+        return [(deepface_crop(face, target_size)[np.newaxis], {}, 1.0)]
+
+    commons = types.ModuleType("deepface.commons")
+    commons.functions = types.SimpleNamespace(extract_faces=extract_faces)
+    monkeypatch.setitem(sys.modules, "deepface", types.ModuleType("deepface"))
+    monkeypatch.setitem(sys.modules, "deepface.commons", commons)
+    return face_crop(np.zeros((480, 640, 3), dtype=np.uint8))
+
+
+def test_fit_face_pads_and_scales_to_unit_range():
+    face = np.full((60, 30, 3), 255, dtype=np.uint8)
+    crop = fit_face(face, EMOTION_INPUT_SIZE)
+    assert crop.shape == (48, 48, 3)
+    assert crop.dtype == np.float32
+    assert crop.max() == pytest.approx(1.0)
+    # Narrow face: zero padding on the left and right, none above or below
+    assert crop[:, 0].max() == 0 and crop[:, -1].max() == 0
+    assert crop[:, 24].min() == pytest.approx(1.0)
+
+
+def test_tracked_and_detected_crops_match(monkeypatch):
+    # A smooth face, so resampling through 224x224 on the detected path changes little
+    y, x = np.mgrid[0:80, 0:64]
+    face = np.stack([x * 4, y * 3, x + y], axis=-1).astype(np.uint8)
+    # 80x64 scales by 0.6 to 48x38, centred with five zero columns either side
+    expected = np.zeros((48, 48, 3), dtype=np.float32)
+    expected[:, 5:43] = cv2.resize(face, (38, 48)) / 255
+
+    tracked = fit_face(face, EMOTION_INPUT_SIZE)
+    detected = detected_crop(monkeypatch, face)
+    assert tracked.dtype == detected.dtype == np.float32
+    assert tracked.shape == detected.shape == expected.shape
+    assert np.allclose(tracked, expected)
+    assert np.allclose(detected[:, 6:42], expected[:, 6:42], atol=0.02)
+    check_crops(np.stack([tracked, detected]))
+
+
+def test_check_crops_rejects_raw_pixels():
+    with pytest.raises(ValueError):
+        check_crops(np.full((2, 48, 48, 3), 255, dtype=np.uint8))
+    with pytest.raises(ValueError):
+        check_crops(np.full((2, 48, 48, 3), 255, dtype=np.float32))
@@ -0,0 +1,57 @@
+import pytest
+
+from interviewly.fillers import FillerScanner, FillerStream
+
+
+def timed(text, start=0.0):
+    """One ``(word, start, end)`` tuple per word, a second apart from ``start``."""
+    return [(word, start + i, start + i + 1) for i, word in enumerate(text.split())]
+
+
+# --- Trie Scanner ---
+def test_scan_matches_multi_word_phrases_case_insensitively():
+    scanner = FillerScanner(["um", "you know", "kind of"])
+    matches = scanner.scan(timed("Um, I kind of... You know, know you"))
+    assert [phrase for phrase, _, _ in matches] == ["um", "kind of", "you know"]
+
+
+def test_scan_prefers_the_longest_match():
+    scanner = FillerScanner(["you know", "you know what i mean", "i mean"])
+    matches = scanner.scan(timed("you know what i mean you know what i"))
+    assert [phrase for phrase, _, _ in matches] == ["you know what i mean", "you know"]
+
+
+def test_report_positions_and_rates():
+    scanner = FillerScanner(["uh", "you know"])
+    words = timed("uh so you know uh", start=10)
+    report = scanner.report(words, duration_seconds=120)
+    # Multi-word matches span from the first word's start to the last word's end
+    assert report["positions"] == [("uh", 10, 11), ("you know", 12, 14), ("uh", 14, 15)]
+    assert report["counts"] == {"uh": 2, "you know": 1}
+    assert report["per_minute"] == pytest.approx(1.5)
+    assert report["per_minute_by_filler"] == {"uh": pytest.approx(1.0), "you know": pytest.approx(0.5)}
+    # Without a duration the rate is taken over the spoken span (10s to 15s)
+    assert scanner.report(words)["per_minute"] == pytest.approx(36.0)
+
+
+def test_for_language_names_configured_languages():
+    with pytest.raises(ValueError, match="configured: en"):
+        FillerScanner.for_language("xx")
+
+
+# --- Running Count ---
+def test_stream_counts_phrases_across_segments():
+    scanner = FillerScanner(["um", "you know", "you know what i mean"])
+    segments = [timed("um so you", 0), timed("know what", 3), timed("i mean um you", 5), timed("know", 9)]
+    stream = FillerStream(scanner)
+    # The first "you know" grows into "you know what i mean"; the last one spans the final two segments
+    assert [stream.add(segment) for segment in segments] == [1, 2, 3, 4]
+    assert len(scanner.scan([word for segment in segments for word in segment])) == 4
+
+
+def test_stream_matches_full_scan_after_every_segment():
+    scanner = FillerScanner(["uh", "like", "you know", "i mean"])
+    words = timed("uh i like you know i mean uh you know like i mean you")
+    stream = FillerStream(scanner)
+    for end in range(1, len(words) + 1):
+        assert stream.add(words[end - 1:end]) == len(scanner.scan(words[:end]))
@@ -0,0 +1,19 @@
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+
+from benchmarks.synthetic import make_video
+from interviewly.pipeline import compare_to_full_resolution
+
+
+def test_compare_to_full_resolution_reports_pixel_savings(tmp_path):
+    video = make_video(str(tmp_path / "clip.mp4"), width=640, height=360, fps=10, seconds=1, audio=False)
+    report = compare_to_full_resolution(video, "fast", names=("eyecontact", "gesture"), use_cache=False)
+
+    assert set(report) == {"eyecontact", "gesture"}
+    for name, entry in report.items():
+        assert set(entry["full"]) == set(entry["preprocessed"])
+        assert entry["max_delta"] == max(abs(entry["full"][key] - entry["preprocessed"][key]) for key in entry["full"])
+        # "fast" caps the model input at 480 px, so a 640x360 frame sends at most (480x270)/(640x360) of its pixels
+        assert 0 < entry["pixel_ratio"] <= 0.5625 + 1e-9
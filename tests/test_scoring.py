@@ -0,0 +1,152 @@
+import numpy as np
+import pytest
+
+from interviewly.scoring import (
+    GESTURES, FACE_POINTS, POSE_POINTS, HAND_POINTS, MAX_HANDS, LEFT_EYE, RIGHT_EYE, NOSE,
+    LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP, WRIST, THUMB_TIP, INDEX_FINGER_TIP, PINKY_TIP,
+    eye_contact_labels, posture_labels, hand_gestures, gesture_labels, frame_weights, ratio_score, gesture_score,
+)
+
+
+# --- Synthetic Landmarks ---
+def face(eye_offsets):
+    """One face per frame with both eye midpoints ``offset`` to the right of the nose; None = no face."""
+    points = np.full((len(eye_offsets), FACE_POINTS, 3), np.nan, dtype=np.float32)
+    for i, offset in enumerate(eye_offsets):
+        if offset is None:
+            continue
+        points[i] = 0.5
+        points[i, NOSE, 0] = 0.5
+        for eye in (LEFT_EYE, RIGHT_EYE):
+            points[i, eye, 0] = 0.5 + offset
+    return points
+
+
+def pose(slopes):
+    """One pose per frame with shoulders and hips tilted by ``(shoulder, hip)``; None = no body."""
+    points = np.full((len(slopes), POSE_POINTS, 3), np.nan, dtype=np.float32)
+    for i, slope in enumerate(slopes):
+        if slope is None:
+            continue
+        shoulder, hip = slope
+        points[i] = 0.5
+        points[i, LEFT_SHOULDER, 1], points[i, RIGHT_SHOULDER, 1] = 0.3, 0.3 + shoulder
+        points[i, LEFT_HIP, 1], points[i, RIGHT_HIP, 1] = 0.7, 0.7 + hip
+    return points
+
+
+HAND_SHAPES = {
+    # fingertip heights relative to the wrist (negative = above it): thumb, index, pinky
+    "Thumbs Up": (-0.1, -0.1, 0.1),
+    "Victory": (0.1, -0.1, -0.1),
+    "Open Palm": (0.1, 0.1, 0.1),
+    "No Hand": (-0.1, 0.1, 0.1),  # matches no rule
+}
+
+
+def hands(frames):
+    """Frames of up to two hands, each given as a HAND_SHAPES name; None = empty slot."""
+    points = np.full((len(frames), MAX_HANDS * HAND_POINTS, 3), np.nan, dtype=np.float32)
+    for i, shapes in enumerate(frames):
+        for slot, shape in enumerate(shapes):
+            if shape is None:
+                continue
+            hand = points[i, slot * HAND_POINTS:(slot + 1) * HAND_POINTS]
+            hand[:] = 0.5
+            thumb, index, pinky = HAND_SHAPES[shape]
+            hand[THUMB_TIP, 1], hand[INDEX_FINGER_TIP, 1], hand[PINKY_TIP, 1] = 0.5 + thumb, 0.5 + index, 0.5 + pinky
+            hand[WRIST, 1] = 0.5
+    return points
+
+
+# --- Per-Frame Rules ---
+def test_eye_contact_labels():
+    labels = eye_contact_labels(face([0.0, 0.04, -0.04, 0.06, -0.2]), threshold=0.05)
+    assert labels.tolist() == [True, True, True, False, False]
+
+
+def test_posture_labels():
+    labels = posture_labels(pose([(0.0, 0.0), (0.04, -0.04), (0.1, 0.0), (0.0, 0.1)]), threshold=0.05)
+    assert labels.tolist() == [True, True, False, False]
+
+
+def test_hand_gestures_per_slot():
+    per_hand = hand_gestures(hands([("Thumbs Up", "Victory"), ("Open Palm", None)]))
+    assert [[GESTURES[g] for g in frame] for frame in per_hand] == [["Thumbs Up", "Victory"], ["Open Palm", "No Hand"]]
+
+
+def test_nan_rows_are_negative():
+    assert not eye_contact_labels(face([None]))[0]
+    assert not posture_labels(pose([None]))[0]
+    assert GESTURES[gesture_labels(hands([(None, None)]))[0]] == "No Hand"
+
+
+def test_second_hand_fallback():
+    labels = gesture_labels(hands([
+        ("Thumbs Up", "Victory"),  # first hand decides
+        ("No Hand", "Victory"),  # first hand shows no gesture: second one counts
+        (None, "Open Palm"),
+        ("No Hand", "No Hand"),
+    ]))
+    assert [GESTURES[label] for label in labels] == ["Thumbs Up", "Victory", "Open Palm", "No Hand"]
+
+
+# --- Aggregation ---
+def test_frame_weights_cover_every_frame():
+    frames = [10, 13, 14, 20]
+    weights = frame_weights(frames, end_frame=25)
+    assert weights.tolist() == [3, 1, 6, 5]
+    assert weights.sum() == 25 - 10
+
+
+def test_ratio_score_totals():
+    labels = np.array([True, False, True])
+    weights = frame_weights([0, 5, 7], end_frame=10)
+    score, hits, total, sampled = ratio_score(labels, weights)
+    assert (hits, total, sampled) == (5 + 3, 10, 3)
+    assert score == pytest.approx(80.0)
+
+
+def test_gesture_score_counts_every_frame():
+    labels = np.array([GESTURES.index("Victory"), GESTURES.index("No Hand")])
+    counts, sampled = gesture_score(labels, frame_weights([0, 4], end_frame=6))
+    assert counts["Victory"] == 4 and counts["No Hand"] == 2
+    assert sum(counts.values()) == 6 and sampled == 2
+
+
+# --- Re-Scoring Parity ---
+@pytest.mark.parametrize("name, points", [
+    ("eyecontact", face([0.0, 0.2, None, 0.01, 0.3, 0.0, None, 0.0, 0.2, 0.0] * 3)),
+    ("posture", pose([(0.0, 0.0), (0.2, 0.0), None, (0.0, 0.3), (0.01, 0.0)] * 6)),
+    ("gesture", hands([("Victory", None), (None, None), ("No Hand", "Open Palm"), ("Thumbs Up", "Victory")] * 8)),
+])
+def test_rescore_matches_analyzer(name, points):
+    pytest.importorskip("mediapipe")
+    from interviewly.analyzers import LabelAnalyzer
+    from interviewly.landmarks import rescore
+    from interviewly.pipeline import ANALYZERS
+
+    class Replay(ANALYZERS[name]):
+        """The real analyzer with inference replaced by the given landmarks (passed in as the frame)."""
+
+        def __init__(self):
+            LabelAnalyzer.__init__(self, sampling={"mode": "stride", "stride": 3}, record_landmarks=True)
+            self.threshold = 0.05
+
+        def detect(self, frame_rgb):
+            return None if np.isnan(frame_rgb).all() else frame_rgb
+
+    analyzer = Replay()
+    analyzer.chunk_frames = 4  # exercise several flushes
+    analyzer.chunk = np.full((4, analyzer.landmark_count, 3), np.nan, dtype=np.float32)
+    start_frame = 7
+    analyzer.start(30)
+    for offset, frame_points in enumerate(points):
+        analyzer.process(start_frame + offset, None, frame_points)
+
+    result = analyzer.result()
+    assert rescore(name, analyzer.recording()) == result
+    if name == "gesture":
+        assert sum(result[0].values()) == analyzer.total_frames
+    else:
+        assert result[2] == analyzer.total_frames